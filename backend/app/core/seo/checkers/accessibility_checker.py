@@ -41,7 +41,7 @@ class AccessibilityChecker(BaseChecker):
                         category="Accessibility",
                         issue="Form Input Elements Require Labels",
                         description="表单输入元素缺少关联的label标签，这影响无障碍访问。",
-                        affected_element=str(input_tag)[:100] + ('...' if len(str(input_tag)) > 100 else ''),
+                        affected_element=self.truncate_element(input_tag),
                         priority="high",
                         issue_type="warnings"
                     )
@@ -49,38 +49,36 @@ class AccessibilityChecker(BaseChecker):
     
     def check_images_accessibility(self):
         """检查图片无障碍访问问题"""
+        # 只报告一次，find 在第一个命中处即停止遍历，无需构建完整列表
         # 检查图片是否有alt文本
-        img_tags = self.soup.find_all('img')
-        for img in img_tags:
-            if not img.has_attr('alt'):
-                self.add_issue(
-                    category="Accessibility",
-                    issue="Image Missing Alt Text",
-                    description="图片缺少alt属性，这对屏幕阅读器用户是必要的。",
-                    affected_element=str(img)[:100] + ('...' if len(str(img)) > 100 else ''),
-                    priority="high",
-                    issue_type="issues"
-                )
-                break  # 只报告一次
+        img = self.soup.find('img', alt=False)
+        if img:
+            self.add_issue(
+                category="Accessibility",
+                issue="Image Missing Alt Text",
+                description="图片缺少alt属性，这对屏幕阅读器用户是必要的。",
+                affected_element=self.truncate_element(img),
+                priority="high",
+                issue_type="issues"
+            )
         
         # 检查是否使用图片作为button但没有适当的aria标签
-        img_buttons = self.soup.find_all('input', attrs={'type': 'image'})
-        for img_button in img_buttons:
-            if not (img_button.has_attr('alt') or img_button.has_attr('aria-label')):
-                self.add_issue(
-                    category="Accessibility",
-                    issue="Image Button Without Accessible Name",
-                    description="图片按钮需要alt属性或aria-label属性来提供可访问的名称。",
-                    affected_element=str(img_button)[:100] + ('...' if len(str(img_button)) > 100 else ''),
-                    priority="high",
-                    issue_type="issues"
-                )
-                break  # 只报告一次
+        img_button = self.soup.find('input', attrs={'type': 'image', 'alt': False, 'aria-label': False})
+        if img_button:
+            self.add_issue(
+                category="Accessibility",
+                issue="Image Button Without Accessible Name",
+                description="图片按钮需要alt属性或aria-label属性来提供可访问的名称。",
+                affected_element=self.truncate_element(img_button),
+                priority="high",
+                issue_type="issues"
+            )
     
     def check_keyboard_accessibility(self):
         """检查键盘导航无障碍问题"""
         # 检查tabindex值是否合理
-        elements_with_tabindex = self.soup.find_all(attrs={'tabindex': True})
+        all_tags = self.get_all_tags()
+        elements_with_tabindex = [el for el in all_tags if el.get('tabindex') is not None]
         for element in elements_with_tabindex:
             try:
                 tabindex = int(element['tabindex'])
@@ -89,7 +87,7 @@ class AccessibilityChecker(BaseChecker):
                         category="Accessibility",
                         issue="Positive Tabindex Value",
                         description="使用正tabindex值(>0)会破坏正常的键盘导航顺序，应避免使用。",
-                        affected_element=str(element)[:100] + ('...' if len(str(element)) > 100 else ''),
+                        affected_element=self.truncate_element(element),
                         priority="medium",
                         issue_type="warnings"
                     )
@@ -98,8 +96,9 @@ class AccessibilityChecker(BaseChecker):
                 continue
         
         # 检查a标签是否有href属性
-        a_tags_without_href = self.soup.find_all('a', href=False)
-        a_tags_with_empty_href = self.soup.find_all('a', href='')
+        a_tags = [el for el in all_tags if el.name == 'a']
+        a_tags_without_href = [a for a in a_tags if a.get('href') is None]
+        a_tags_with_empty_href = [a for a in a_tags if a.get('href') == '']
         problematic_links = a_tags_without_href + a_tags_with_empty_href
         
         if problematic_links:
@@ -107,13 +106,13 @@ class AccessibilityChecker(BaseChecker):
                 category="Accessibility",
                 issue="Links Without Valid HREF",
                 description="没有有效href属性的链接不能通过键盘访问，应使用按钮而不是空链接。",
-                affected_element=str(problematic_links[0])[:100] + ('...' if len(str(problematic_links[0])) > 100 else ''),
+                affected_element=self.truncate_element(problematic_links[0]),
                 priority="medium",
                 issue_type="warnings"
             )
             
         # 检查onclick事件是否有键盘等效事件
-        clickable_elements = self.soup.find_all(attrs={'onclick': True})
+        clickable_elements = [el for el in all_tags if el.get('onclick') is not None]
         for element in clickable_elements:
             # 检查是否有键盘等效事件(onkeydown, onkeyup, onkeypress)
             has_keyboard_event = any(element.has_attr(attr) for attr in ['onkeydown', 'onkeyup', 'onkeypress'])
@@ -122,7 +121,7 @@ class AccessibilityChecker(BaseChecker):
                     category="Accessibility",
                     issue="Clickable Element Not Keyboard Accessible",
                     description="带有onclick事件的元素应提供键盘等效事件，或使用天然可键盘访问的元素如按钮。",
-                    affected_element=str(element)[:100] + ('...' if len(str(element)) > 100 else ''),
+                    affected_element=self.truncate_element(element),
                     priority="medium",
                     issue_type="warnings"
                 )
@@ -1,13 +1,18 @@
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 from bs4 import BeautifulSoup, Tag
 import re
 
+# 合法的问题类型
+ISSUE_TYPES = frozenset(("issues", "warnings", "opportunities"))
+
 class BaseChecker:
     """SEO检查器的基类，提供通用功能和接口"""
     
     def __init__(self, soup: BeautifulSoup, page_url: Optional[str] = None):
         self.soup = soup
         self.page_url = page_url
+        # 文档中所有标签（文档顺序），按需收集；调用方可在多个检查器之间共享同一份列表
+        self.all_tags: Optional[List[Tag]] = None
         self.issues = {
             "issues": [],      # 问题 - 需要修复的错误
             "warnings": [],    # 警告 - 需要检查但不一定是问题的项目
@@ -27,7 +32,7 @@ class BaseChecker:
                  affected_resources: Optional[List[str]] = None,
                  issue_type: str = "issues"):
         # 验证issue_type合法性
-        if issue_type not in ["issues", "warnings", "opportunities"]:
+        if issue_type not in ISSUE_TYPES:
             issue_type = "issues"  # 默认为issues
             
         # 创建问题数据字典
@@ -42,8 +47,7 @@ class BaseChecker:
         if affected_element:
             if isinstance(affected_element, Tag):
                 # 将BeautifulSoup Tag对象转换为字符串并截断
-                element_str = str(affected_element)
-                affected_element = element_str[:100] + ('...' if len(element_str) > 100 else '')
+                affected_element = self.truncate_element(affected_element)
             issue_data["affected_element"] = affected_element
             
         # 处理受影响的资源
@@ -53,9 +57,24 @@ class BaseChecker:
         # 添加到相应的问题列表
         self.issues[issue_type].append(issue_data)
         
+    def add_issue_spec(self,
+                       issue_spec: Tuple[str, str, str, str, str],
+                       affected_element: Optional[Union[str, Tag]] = None,
+                       affected_resources: Optional[List[str]] = None):
+        # 按预定义的(category, issue, description, priority, issue_type)元组添加问题
+        category, issue, description, priority, issue_type = issue_spec
+        self.add_issue(category, issue, description, priority,
+                       affected_element, affected_resources, issue_type)
+        
     def get_issues(self) -> Dict[str, List[Dict[str, Any]]]:
         return self.issues
     
+    def get_all_tags(self) -> List[Tag]:
+        # 返回文档中的所有标签，首次调用时遍历一次文档树
+        if self.all_tags is None:
+            self.all_tags = self.soup.find_all(True)
+        return self.all_tags
+    
     def truncate_element(self, element: Tag, max_length: int = 100) -> str:
         if not element:
             return ""
@@ -12,13 +12,41 @@ Date: 2025
 """
 
 import re
+import atexit
+import functools
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+
+from app.core.seo.utils.seo_utils import count_chinese_chars, find_soft_404_phrase
+
+# LanguageTool rule ID prefixes that denote spelling (rather than grammar) errors
+SPELLING_RULE_PREFIXES = ('MORFOLOGIK_', 'SPELLING')
+
+# Sentence terminators (Chinese and Western); runs collapse since empty pieces are dropped anyway
+SENTENCE_SPLIT_RE = re.compile(r'[。！？.!?]+')
+
+
+@functools.lru_cache(maxsize=1024)
+def english_readability_scores(textstat: Any, sample_text: str) -> Tuple[float, float]:
+    """
+    Flesch reading ease and Flesch-Kincaid grade for a text sample.
+    Cached so repeated or templated page content is scored only once per process.
+    """
+    return textstat.flesch_reading_ease(sample_text), textstat.flesch_kincaid_grade(sample_text)
 
 
 class ContentAnalyzer:
+    # LanguageTool instances shared across pages, one (tool, lock) pair per language.
+    # Each instance owns a Java server process, so startup is paid once; the per-tool
+    # lock serialises check() since pages are analysed from several worker threads.
+    _LT_POOL: Dict[str, Tuple[Any, threading.Lock]] = {}
+    _LT_LOCK = threading.Lock()
+    
     def __init__(self, enable_advanced_analysis: bool = True):
         self.enable_advanced_analysis = enable_advanced_analysis
+        # Set when advanced analysis hit an unexpected error and returned empty results
+        self.analysis_failed = False
         
         # Initialize logging with module-specific logger
         self.logger = logging.getLogger(f'{__name__}.ContentAnalyzer')
@@ -54,29 +82,22 @@ class ContentAnalyzer:
             if not language_tool_python or not textstat:
                 return analysis_results
                 
+            # Limit text length to avoid performance issues; every step below
+            # (language detection included) only looks at this sample
+            sample_text = text_content[:5000]  # Take first 5000 characters
+            
             # Detect page main language
-            is_chinese = self._detect_language(text_content)
+            is_chinese = self._detect_language(sample_text)
             lang = 'zh-CN' if is_chinese else 'en-US'
             
-            # Initialize LanguageTool
-            tool = language_tool_python.LanguageTool(lang)
+            # Perform grammar and spelling check with the pooled LanguageTool for this language
+            matches = self._check_with_language_tool(language_tool_python, lang, sample_text)
             
-            try:
-                # Limit text length to avoid performance issues
-                sample_text = text_content[:5000]  # Take first 5000 characters
-                
-                # Perform grammar and spelling check
-                matches = tool.check(sample_text)
-                
-                # Process and classify errors
-                self._process_language_errors(matches, sample_text, analysis_results)
-                
-                # Perform readability analysis
-                self._analyze_readability(sample_text, is_chinese, textstat, analysis_results)
-                
-            finally:
-                # Always close the tool to free resources
-                tool.close()
+            # Process and classify errors
+            self._process_language_errors(matches, sample_text, analysis_results)
+            
+            # Perform readability analysis
+            self._analyze_readability(sample_text, is_chinese, textstat, analysis_results)
             
             self.logger.info(
                 f"Analysis completed: {len(analysis_results['spelling_errors'])} spelling errors, "
@@ -94,8 +115,59 @@ class ContentAnalyzer:
             return analysis_results
         except Exception as e:
             self.logger.error(f"执行高级内容分析时出错：{str(e)}")
+            self.analysis_failed = True
             return analysis_results
     
+    @classmethod
+    def _get_language_tool(cls, language_tool_python: Any, lang: str) -> Tuple[Any, threading.Lock]:
+        """Return the pooled (LanguageTool, lock) pair for lang, creating it on first use."""
+        entry = cls._LT_POOL.get(lang)
+        if entry is not None:
+            return entry
+        
+        with cls._LT_LOCK:
+            entry = cls._LT_POOL.get(lang)
+            if entry is None:
+                entry = (language_tool_python.LanguageTool(lang), threading.Lock())
+                cls._LT_POOL[lang] = entry
+        return entry
+    
+    @classmethod
+    def _check_with_language_tool(cls, language_tool_python: Any, lang: str, text: str) -> List:
+        """
+        Run check() on the pooled tool, one caller at a time. If the check fails
+        (e.g. the Java server died), the tool is evicted and closed so the next
+        page starts a fresh instance instead of reusing a broken one.
+        """
+        entry = cls._get_language_tool(language_tool_python, lang)
+        tool, tool_lock = entry
+        with tool_lock:
+            try:
+                return tool.check(text)
+            except Exception:
+                with cls._LT_LOCK:
+                    if cls._LT_POOL.get(lang) is entry:
+                        del cls._LT_POOL[lang]
+                try:
+                    tool.close()
+                except Exception:
+                    pass
+                raise
+    
+    @classmethod
+    def close_language_tools(cls) -> None:
+        """Close all pooled LanguageTool instances."""
+        # Detach the pool first so the pool lock is never held while waiting on a tool lock
+        with cls._LT_LOCK:
+            entries = list(cls._LT_POOL.values())
+            cls._LT_POOL.clear()
+        for tool, tool_lock in entries:
+            with tool_lock:
+                try:
+                    tool.close()
+                except Exception:
+                    pass
+    
     def _safe_import(self, module_name: str) -> Optional[Any]:
         try:
             return __import__(module_name)
@@ -107,7 +179,7 @@ class ContentAnalyzer:
         if not text_content:
             return False
             
-        chinese_chars = sum(1 for c in text_content if '\u4e00' <= c <= '\u9fff')
+        chinese_chars = count_chinese_chars(text_content)
         total_chars = len(text_content)
         
         if total_chars == 0:
@@ -120,6 +192,8 @@ class ContentAnalyzer:
         return is_chinese
     
     def _process_language_errors(self, matches: List, sample_text: str, analysis_results: Dict[str, Any]) -> None:
+        spelling_errors = analysis_results["spelling_errors"]
+        grammar_errors = analysis_results["grammar_errors"]
         for match in matches:
             # Use validation method to filter false positives
             if not self.is_valid_error(match, sample_text):
@@ -134,18 +208,17 @@ class ContentAnalyzer:
             }
             
             # Classify errors based on rule ID
-            if match.ruleId.startswith(('MORFOLOGIK_', 'SPELLING')):
-                analysis_results["spelling_errors"].append(error_data)
+            if match.ruleId.startswith(SPELLING_RULE_PREFIXES):
+                spelling_errors.append(error_data)
             else:
-                analysis_results["grammar_errors"].append(error_data)
+                grammar_errors.append(error_data)
     
     def _analyze_readability(self, sample_text: str, is_chinese: bool, textstat: Any, 
                            analysis_results: Dict[str, Any]) -> None:
         try:
             if not is_chinese and len(sample_text) > 100:
                 # English readability analysis
-                reading_ease = textstat.flesch_reading_ease(sample_text)
-                grade_level = textstat.flesch_kincaid_grade(sample_text)
+                reading_ease, grade_level = english_readability_scores(textstat, sample_text)
                 
                 analysis_results["readability"] = {
                     "reading_ease": reading_ease,
@@ -161,22 +234,28 @@ class ContentAnalyzer:
                 )
             else:
                 # Chinese readability analysis - sentence length based
-                sentences = re.split(r'[。！？.!?]', sample_text)
-                sentences = [s.strip() for s in sentences if len(s.strip()) > 0]
+                # Single pass: count non-empty sentences and their stripped length together
+                sentence_count = 0
+                total_length = 0
+                for sentence in SENTENCE_SPLIT_RE.split(sample_text):
+                    sentence_length = len(sentence.strip())
+                    if sentence_length:
+                        sentence_count += 1
+                        total_length += sentence_length
                 
-                if sentences:
-                    avg_sentence_length = sum(len(s) for s in sentences) / len(sentences)
+                if sentence_count:
+                    avg_sentence_length = total_length / sentence_count
                     
                     analysis_results["readability"] = {
                         "avg_sentence_length": avg_sentence_length,
                         "is_long_sentences": avg_sentence_length > 50,
-                        "sentence_count": len(sentences),
+                        "sentence_count": sentence_count,
                         "language": "chinese"
                     }
                     
                     self.logger.debug(
-                        f"Chinese readability: avg_length={avg_sentence_length:.1f}, "
-                        f"sentences={len(sentences)}"
+                        "Chinese readability: avg_length=%.1f, sentences=%d",
+                        avg_sentence_length, sentence_count
                     )
         except Exception as e:
             self.logger.warning(f"Readability analysis failed: {str(e)}")
@@ -353,17 +432,9 @@ class ContentAnalyzer:
         if not text_content:
             return False
             
-        soft_404_patterns = [
-            "找不到页面", "不存在", "已删除", "page not found", "404", 
-            "does not exist", "no longer available", "been removed",
-            "无法找到", "抱歉，您访问的页面不存在", "sorry, the page you requested was not found"
-        ]
-        
-        text_lower = text_content.lower()
-        matched_patterns = [p for p in soft_404_patterns if p.lower() in text_lower]
-        
-        if matched_patterns:
-            self.logger.debug(f"检测到软404模式: {matched_patterns}")
+        phrase = find_soft_404_phrase(text_content)
+        if phrase:
+            self.logger.debug("检测到软404模式: %s", phrase)
             return True
             
         return False
@@ -428,5 +499,8 @@ class ContentAnalyzer:
     
     def _count_sentences(self, text_content: str) -> int:
         """Count the number of sentences in the text."""
-        sentences = re.split(r'[。！？.!?]', text_content)
-        return len([s for s in sentences if s.strip()])
\ No newline at end of file
+        sentences = SENTENCE_SPLIT_RE.split(text_content)
+        return len([s for s in sentences if s.strip()])
+
+
+atexit.register(ContentAnalyzer.close_language_tools)
@@ -14,7 +14,7 @@ class ContentChecker(BaseChecker):
         super().__init__(soup, page_url)
         
         # Initialize component modules
-        self.extractor = ContentExtractor(soup, content_extractor)
+        self.extractor = ContentExtractor(soup, content_extractor, page_url)
         self.analyzer = ContentAnalyzer(enable_advanced_analysis)
         self.validator = ContentValidator()
         
@@ -22,6 +22,9 @@ class ContentChecker(BaseChecker):
         self.content_extractor = content_extractor
         self.enable_advanced_analysis = enable_advanced_analysis
         
+        # 高级内容分析是否因异常而没有得到完整结果
+        self.analysis_failed = False
+        
         # Store extracted content
         self.extracted_content = {
             "text": "",
@@ -63,11 +66,12 @@ class ContentChecker(BaseChecker):
         
         # Basic content checks
         # Check content length
-        if len(text_content) < 300:
+        text_length = len(text_content)
+        if text_length < 300:
             self.add_issue(
                 category="Content",
                 issue="Low Content Pages",
-                description=f"页面内容过少，仅有约{len(text_content)}个字符，可能被视为薄内容。",
+                description=f"页面内容过少，仅有约{text_length}个字符，可能被视为薄内容。",
                 priority="medium",
                 issue_type="opportunities"
             )
@@ -104,6 +108,7 @@ class ContentChecker(BaseChecker):
         try:
             # Get analysis results from analyzer
             analysis_results = self.analyzer.perform_advanced_content_analysis(text_content)
+            self.analysis_failed = self.analyzer.analysis_failed
             
             # Update extracted content with analysis results
             self.extracted_content["spelling_errors"] = analysis_results.get("spelling_errors", [])
@@ -205,8 +210,8 @@ class ContentChecker(BaseChecker):
                         issue_type="opportunities"
                     )
             
-            # Check for Soft 404 pages
-            if self.analyzer.check_soft_404_content(text_content) and self.page_url and "404" not in self.page_url:
+            # Check for Soft 404 pages (cheap URL checks first so the text is only scanned when it matters)
+            if self.page_url and "404" not in self.page_url and self.analyzer.check_soft_404_content(text_content):
                 self.add_issue(
                     category="Content",
                     issue="Soft 404 Page",
@@ -217,6 +222,7 @@ class ContentChecker(BaseChecker):
                 
         except Exception as e:
             # Catch any exceptions from advanced analysis to avoid affecting main functionality
+            self.analysis_failed = True
             self.add_issue(
                 category="Content",
                 issue="Content Analysis Error",
@@ -227,53 +233,50 @@ class ContentChecker(BaseChecker):
     
     def check_images(self):
         """检查图片相关问题"""
-        img_tags = self.soup.find_all('img')
+        # Single pass over the images: remember the first offender of each kind and
+        # stop as soon as both are known (each problem is only reported once)
+        alt_issue = None
+        size_issue_img = None
         
-        # Check if all images have alt attribute
-        for img in img_tags:
-            if not img.has_attr('alt'):
-                self.add_issue(
-                    category="Images",
-                    issue="Missing Alt Attribute",
-                    description="图片缺少alt属性，这对于SEO和无障碍访问至关重要。",
-                    affected_element=str(img)[:100] + ('...' if len(str(img)) > 100 else ''),
-                    priority="low",
-                    issue_type="issues"
-                )
-                break  # Only report once
-            elif img['alt'].strip() == '':
-                self.add_issue(
-                    category="Images",
-                    issue="Missing Alt Text",
-                    description="图片的alt属性是空的，应该提供描述性的替代文本。",
-                    affected_element=str(img)[:100] + ('...' if len(str(img)) > 100 else ''),
-                    priority="low",
-                    issue_type="issues"
-                )
-                break  # Only report once
-            elif len(img['alt']) > 100:
-                self.add_issue(
-                    category="Images",
-                    issue="Alt Text Over 100 Characters",
-                    description=f"图片的alt文本长度为{len(img['alt'])}个字符，超过了100个字符的建议长度。",
-                    affected_element=str(img)[:100] + ('...' if len(str(img)) > 100 else ''),
-                    priority="low",
-                    issue_type="opportunities"
-                )
-                break  # Only report once
+        for img in self.soup.find_all('img'):
+            # Check if all images have alt attribute
+            if alt_issue is None:
+                if not img.has_attr('alt'):
+                    alt_issue = ("Missing Alt Attribute", "图片缺少alt属性，这对于SEO和无障碍访问至关重要。", "issues", img)
+                elif img['alt'].strip() == '':
+                    alt_issue = ("Missing Alt Text", "图片的alt属性是空的，应该提供描述性的替代文本。", "issues", img)
+                elif len(img['alt']) > 100:
+                    alt_issue = ("Alt Text Over 100 Characters",
+                                 f"图片的alt文本长度为{len(img['alt'])}个字符，超过了100个字符的建议长度。",
+                                 "opportunities", img)
+            
+            # Check if images have size attributes
+            if size_issue_img is None and not (img.has_attr('width') and img.has_attr('height')):
+                size_issue_img = img
+            
+            if alt_issue is not None and size_issue_img is not None:
+                break
         
-        # Check if images have size attributes
-        for img in img_tags:
-            if not (img.has_attr('width') and img.has_attr('height')):
-                self.add_issue(
-                    category="Images",
-                    issue="Missing Size Attributes",
-                    description="图片缺少宽度和高度属性，这可能导致页面加载时的布局偏移(CLS)。",
-                    affected_element=str(img)[:100] + ('...' if len(str(img)) > 100 else ''),
-                    priority="low",
-                    issue_type="opportunities"
-                )
-                break  # Only report once
+        if alt_issue is not None:
+            issue, description, issue_type, img = alt_issue
+            self.add_issue(
+                category="Images",
+                issue=issue,
+                description=description,
+                affected_element=self.truncate_element(img),
+                priority="low",
+                issue_type=issue_type
+            )
+        
+        if size_issue_img is not None:
+            self.add_issue(
+                category="Images",
+                issue="Missing Size Attributes",
+                description="图片缺少宽度和高度属性，这可能导致页面加载时的布局偏移(CLS)。",
+                affected_element=self.truncate_element(size_issue_img),
+                priority="low",
+                issue_type="opportunities"
+            )
     
     def check_mobile(self):
         """检查移动端相关问题"""
@@ -9,21 +9,15 @@ from typing import Optional, Dict, Any
 from urllib.parse import urlparse
 from bs4 import Tag
 
+from app.core.seo.utils.seo_utils import count_chinese_chars
+
 
 class ContentValidator:   
     def __init__(self):
         """初始化内容验证器"""
-        # 配置日志记录
-        self._setup_logging()
+        # 日志配置由应用入口负责，这里只获取logger
         self.logger = logging.getLogger('ContentValidator')
     
-    def _setup_logging(self):
-        """设置日志配置"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-    
     # ================== 库可用性检查 ==================
     
     def check_library_available(self, library_name: str) -> bool:
@@ -53,10 +47,10 @@ class ContentValidator:
                 return importlib.util.find_spec(library_name) is not None
                 
         except ImportError:
-            self.logger.warning(f"库 {library_name} 未安装或无法导入")
+            self.logger.warning("库 %s 未安装或无法导入", library_name)
             return False
         except Exception as e:
-            self.logger.warning(f"检查库 {library_name} 时出现问题: {str(e)}")
+            self.logger.warning("检查库 %s 时出现问题: %s", library_name, e)
             return False
     
     # ================== HTML元素验证 ==================
@@ -170,7 +164,7 @@ class ContentValidator:
             validation_results["fragment"] = parsed.fragment
             
         except Exception as e:
-            self.logger.warning(f"URL验证失败: {str(e)}")
+            self.logger.warning("URL验证失败: %s", e)
         
         return validation_results
     
@@ -269,7 +263,7 @@ class ContentValidator:
         )
         
         # 简单的语言检测
-        chinese_chars = sum(1 for c in text if '\u4e00' <= c <= '\u9fff')
+        chinese_chars = count_chinese_chars(text)
         total_chars = len(text)
         if total_chars > 0:
             chinese_ratio = chinese_chars / total_chars
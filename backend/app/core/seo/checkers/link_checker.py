@@ -1,12 +1,76 @@
 from .base_checker import BaseChecker
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from bs4 import BeautifulSoup
+from collections import Counter
 import re
 
+# 可选依赖：Aho-Corasick 自动机一次扫描即可识别全部关键词
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# 分页相关正则，模块加载时编译一次
+PAGINATION_HREF_RE = re.compile(r'[?&](page|p)=\d+|/page/\d+|_page=\d+')
+PAGE_NUMBER_RE = re.compile(r'(?:[?&](?:page|p)=|/page/|_page=)(\d+)')
+PAGINATION_ANCHOR_CLASS_RE = re.compile(r'pag|page')
+PAGINATION_CONTAINER_CLASS_RE = re.compile(r'pag|pagination')
+# 明显不是HTML分页页面的URL（脚本伪链接、锚点或图片/PDF文件）
+INVALID_PAGINATION_URL_RE = re.compile(r'^(?:javascript:|void\(|#)|\.(?:jpg|png|gif|pdf)\Z')
+
+# 用于检查非描述性锚文本的关键词
+NON_DESCRIPTIVE_TERMS = [
+    '点击这里', '查看更多', '了解详情', '详情', '点击', '这里', '更多',
+    'click here', 'read more', 'learn more', 'more', 'click', 'here',
+    'details', 'view more', 'see more'
+]
+# 合并为一个忽略大小写的正则，一次扫描代替逐个关键词匹配
+NON_DESCRIPTIVE_TERMS_RE = re.compile('|'.join(map(re.escape, NON_DESCRIPTIVE_TERMS)), re.IGNORECASE)
+
+EMPTY_REL_TOKENS = frozenset()
+
+# 视为站外链接的协议及其完整前缀（如http需以"http://"开头）
+EXTERNAL_SCHEME_PREFIXES = {
+    'http': 'http://',
+    'https': 'https://',
+    'mailto': 'mailto:',
+    'tel': 'tel:',
+}
+# 协议名最长为6个字符，只需在前7个字符内查找冒号
+SCHEME_SEARCH_LIMIT = max(map(len, EXTERNAL_SCHEME_PREFIXES)) + 1
+
+
+def _build_non_descriptive_automaton():
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for term in NON_DESCRIPTIVE_TERMS:
+        automaton.add_word(term.lower(), term)
+    automaton.make_automaton()
+    return automaton
+
+
+NON_DESCRIPTIVE_AUTOMATON = _build_non_descriptive_automaton()
+
+
+def contains_non_descriptive_term(link_text: str) -> bool:
+    """判断锚文本是否包含非描述性关键词，优先使用Aho-Corasick自动机，否则回退到正则"""
+    if NON_DESCRIPTIVE_AUTOMATON is not None:
+        return next(NON_DESCRIPTIVE_AUTOMATON.iter(link_text.lower()), None) is not None
+    return NON_DESCRIPTIVE_TERMS_RE.search(link_text) is not None
+
+
 class LinkChecker(BaseChecker):
     """检查页面链接相关的SEO问题"""
     
+    def __init__(self, soup: BeautifulSoup, page_url: Optional[str] = None):
+        super().__init__(soup, page_url)
+        self._tag_index = None
+    
     def check(self) -> Dict[str, List[Dict[str, Any]]]:
         """执行所有链接相关检查"""
+        self._get_tag_index()
         self.check_links()
         self.check_canonicals()
         self.check_pagination()
@@ -14,23 +78,119 @@ class LinkChecker(BaseChecker):
         
         return self.get_issues()
     
-    def is_nofollow_link(self, link):
-        """检查链接是否带有nofollow属性"""
-        if 'rel' not in link.attrs:
-            return False
-        
-        rel_attr = link['rel']
+    @staticmethod
+    def _rel_tokens(link) -> frozenset:
+        """返回链接rel属性中的全部取值"""
+        rel_attr = link.attrs.get('rel')
         # rel属性可能是列表或字符串
         if isinstance(rel_attr, list):
-            return 'nofollow' in rel_attr
+            return frozenset(rel_attr)
         elif isinstance(rel_attr, str):
-            return 'nofollow' in rel_attr.split()
+            return frozenset(rel_attr.split())
         
-        return False
+        return EMPTY_REL_TOKENS
+    
+    def is_nofollow_link(self, link):
+        """检查链接是否带有nofollow属性"""
+        return 'nofollow' in self._rel_tokens(link)
+    
+    @staticmethod
+    def _attr_has_value(value, target: str) -> bool:
+        """按BeautifulSoup的规则判断属性值（字符串或多值列表）是否匹配target"""
+        if isinstance(value, list):
+            return target in value
+        return value == target
+    
+    @staticmethod
+    def _class_matches(value, pattern) -> bool:
+        """判断class属性中是否有类名匹配给定正则"""
+        if value is None:
+            return False
+        if isinstance(value, list):
+            return any(pattern.search(cls) for cls in value)
+        return bool(pattern.search(value))
+    
+    def _get_tag_index(self) -> Dict[str, Any]:
+        """
+        遍历一次文档树，按标签名把各项检查需要的元素归入对应列表，
+        避免每个检查方法各自调用find_all重复遍历整棵树
+        """
+        if self._tag_index is not None:
+            return self._tag_index
+        
+        index = {
+            'head': None,
+            'a_href': [],
+            'pagination_href_anchors': [],
+            'pagination_class_anchors': [],
+            'canonical': [],
+            'head_canonical': [],
+            'next': [],
+            'prev': [],
+            'hreflang': [],
+            'head_hreflang': [],
+            'meta_robots': None,
+            'pagination_navs': [],
+            'pagination_uls': [],
+        }
+        attr_has_value = self._attr_has_value
+        class_matches = self._class_matches
+        
+        for el in self.get_all_tags():
+            name = el.name
+            attrs = el.attrs
+            
+            if name == 'a':
+                href = attrs.get('href')
+                if href is not None:
+                    index['a_href'].append(el)
+                    if PAGINATION_HREF_RE.search(href):
+                        index['pagination_href_anchors'].append(el)
+                if class_matches(attrs.get('class'), PAGINATION_ANCHOR_CLASS_RE):
+                    index['pagination_class_anchors'].append(el)
+            
+            elif name == 'link':
+                rel = attrs.get('rel')
+                if rel is None:
+                    continue
+                head = index['head']
+                in_head = head is not None and any(parent is head for parent in el.parents)
+                if attr_has_value(rel, 'canonical'):
+                    index['canonical'].append(el)
+                    if in_head:
+                        index['head_canonical'].append(el)
+                if attr_has_value(rel, 'next'):
+                    index['next'].append(el)
+                if attr_has_value(rel, 'prev'):
+                    index['prev'].append(el)
+                if attr_has_value(rel, 'alternate') and attrs.get('hreflang') is not None:
+                    index['hreflang'].append(el)
+                    if in_head:
+                        index['head_hreflang'].append(el)
+            
+            elif name == 'meta':
+                if index['meta_robots'] is None and attrs.get('name') == 'robots':
+                    index['meta_robots'] = el
+            
+            elif name == 'nav' or name == 'div':
+                if class_matches(attrs.get('class'), PAGINATION_CONTAINER_CLASS_RE):
+                    index['pagination_navs'].append(el)
+            
+            elif name == 'ul':
+                if class_matches(attrs.get('class'), PAGINATION_CONTAINER_CLASS_RE):
+                    index['pagination_uls'].append(el)
+            
+            elif name == 'head':
+                if index['head'] is None:
+                    index['head'] = el
+        
+        self._tag_index = index
+        return index
         
     def check_links(self):
         """检查链接相关问题"""
-        links = self.soup.find_all('a', href=True)
+        add_issue = self.add_issue
+        links = self._get_tag_index()['a_href']
         
         # 分类链接
         internal_links = []
@@ -40,14 +200,9 @@ class LinkChecker(BaseChecker):
         non_descriptive_links = []
         empty_anchor_links = []
         
-        # 用于检查非描述性锚文本的关键词
-        non_descriptive_terms = [
-            '点击这里', '查看更多', '了解详情', '详情', '点击', '这里', '更多', 
-            'click here', 'read more', 'learn more', 'more', 'click', 'here', 
-            'details', 'view more', 'see more'
-        ]
-        
-        base_url = self.page_url.split('://')[1].split('/')[0] if self.page_url else None
+        page_url = self.page_url
+        base_url = page_url.split('://')[1].split('/')[0] if page_url else None
+        rel_tokens = self._rel_tokens
         
         for link in links:
             href = link['href'].strip()
@@ -57,10 +212,17 @@ class LinkChecker(BaseChecker):
                 localhost_links.append(link)
                 continue
             
-            # 判断是否为内部链接
+            # 判断是否为内部链接：先按冒号前的协议名查表，再确认完整前缀
+            if href.startswith('#'):
+                has_external_prefix = True
+            else:
+                colon = href.find(':', 0, SCHEME_SEARCH_LIMIT)
+                scheme_prefix = EXTERNAL_SCHEME_PREFIXES.get(href[:colon]) if colon > 0 else None
+                has_external_prefix = scheme_prefix is not None and href.startswith(scheme_prefix)
+            
             is_internal = (
-                not href.startswith(('http://', 'https://', 'mailto:', 'tel:', '#')) or 
-                (self.page_url and href.startswith(self.page_url)) or
+                not has_external_prefix or 
+                (page_url and href.startswith(page_url)) or
                 (base_url and href.startswith('/'))
             )
             
@@ -68,14 +230,15 @@ class LinkChecker(BaseChecker):
                 internal_links.append(link)
                 
                 # 检查是否有nofollow属性
-                if self.is_nofollow_link(link):
+                if 'nofollow' in rel_tokens(link):
                     nofollow_internal_links.append(link)
                 
                 # 检查锚文本
                 link_text = link.text.strip()
-                if not link_text and not link.find('img'):
+                # 无文本时直接遍历子节点查找图片，省去find()构造过滤器的开销
+                if not link_text and not any(node.name == 'img' for node in link.descendants):
                     empty_anchor_links.append(link)
-                elif any(term in link_text.lower() for term in non_descriptive_terms):
+                elif contains_non_descriptive_term(link_text):
                     non_descriptive_links.append(link)
             else:
                 # 外部链接
@@ -83,7 +246,7 @@ class LinkChecker(BaseChecker):
         
         # 检查是否有内部链接
         if not internal_links:
-            self.add_issue(
+            add_issue(
                 "Links",
                 "Pages Without Internal Outlinks",
                 "页面没有内部链接，这可能不利于搜索引擎爬行和用户导航。",
@@ -93,29 +256,29 @@ class LinkChecker(BaseChecker):
         
         # 检查指向localhost的链接
         if localhost_links:
-            self.add_issue(
+            add_issue(
                 "Links",
                 "Outlinks To Localhost",
                 f"页面包含{len(localhost_links)}个指向localhost的链接，这在生产环境中是不适当的。",
                 "high",
-                affected_element=str(localhost_links[0])[:100] + ('...' if len(str(localhost_links[0])) > 100 else ''),
+                affected_element=self.truncate_element(localhost_links[0]),
                 issue_type="issues"
             )
         
         # 检查内部nofollow链接
         if nofollow_internal_links:
-            self.add_issue(
+            add_issue(
                 "Links",
                 "Internal Nofollow Outlinks",
                 f"页面包含{len(nofollow_internal_links)}个带nofollow属性的内部链接，这可能阻止权重传递。",
                 "medium",
-                affected_element=str(nofollow_internal_links[0])[:100] + ('...' if len(str(nofollow_internal_links[0])) > 100 else ''),
+                affected_element=self.truncate_element(nofollow_internal_links[0]),
                 issue_type="warnings"
             )
         
         # 检查外部链接数量
         if len(external_links) > 100:  # 设定阈值为100
-            self.add_issue(
+            add_issue(
                 "Links",
                 "Pages With High External Outlinks",
                 f"页面包含{len(external_links)}个外部链接，过多的外部链接可能分散页面权重。",
@@ -125,7 +288,7 @@ class LinkChecker(BaseChecker):
         
         # 检查内部链接数量
         if len(internal_links) > 150:  # 设定阈值为150
-            self.add_issue(
+            add_issue(
                 "Links",
                 "Pages With High Internal Outlinks",
                 f"页面包含{len(internal_links)}个内部链接，过多的内部链接可能稀释页面权重。",
@@ -135,29 +298,29 @@ class LinkChecker(BaseChecker):
         
         # 检查空锚文本
         if empty_anchor_links:
-            self.add_issue(
+            add_issue(
                 "Links",
                 "Internal Outlinks With No Anchor Text",
                 f"页面包含{len(empty_anchor_links)}个缺少锚文本的内部链接，这对SEO不利。",
                 "low",
-                affected_element=str(empty_anchor_links[0])[:100] + ('...' if len(str(empty_anchor_links[0])) > 100 else ''),
+                affected_element=self.truncate_element(empty_anchor_links[0]),
                 issue_type="opportunities"
             )
         
         # 检查非描述性锚文本
         if non_descriptive_links:
-            self.add_issue(
+            add_issue(
                 "Links",
                 "Non-Descriptive Anchor Text In Internal Outlinks",
                 f"页面包含{len(non_descriptive_links)}个使用非描述性锚文本的内部链接，应使用更有意义的文本。",
                 "low",
-                affected_element=str(non_descriptive_links[0])[:100] + ('...' if len(str(non_descriptive_links[0])) > 100 else ''),
+                affected_element=self.truncate_element(non_descriptive_links[0]),
                 issue_type="opportunities"
             )
         
         # 添加解释性信息
         if len(links) > 0:
-            self.add_issue(
+            add_issue(
                 "Links",
                 "Learn More About Links Warnings",
                 f"页面共有{len(links)}个链接，其中{len(internal_links)}个内部链接和{len(external_links)}个外部链接。" + 
@@ -168,12 +331,15 @@ class LinkChecker(BaseChecker):
     
     def check_canonicals(self):
         """检查规范链接相关问题"""
+        add_issue = self.add_issue
+        tag_index = self._get_tag_index()
+        
         # 查找所有规范链接标签，无论其位置
-        all_canonical_tags = self.soup.find_all('link', rel='canonical')
+        all_canonical_tags = tag_index['canonical']
         
         # 检查是否存在规范链接
         if not all_canonical_tags:
-            self.add_issue(
+            add_issue(
                 "Canonicals",
                 "Missing",
                 "页面缺少规范链接标签，这可能导致重复内容问题。",
@@ -182,25 +348,32 @@ class LinkChecker(BaseChecker):
             )
             return
         
-        # 检查规范链接标签是否位于head标签内
-        head_tag = self.soup.find('head')
-        if head_tag:
-            head_canonical_tags = head_tag.find_all('link', rel='canonical')
-            outside_head_tags = [tag for tag in all_canonical_tags if tag not in head_canonical_tags]
+        # 检查规范链接标签是否位于head标签内（全部位于<head>内时无需逐个比对）
+        if tag_index['head'] and len(tag_index['head_canonical']) < len(all_canonical_tags):
+            head_canonical_tags = tag_index['head_canonical']
+            # 按对象身份比较，避免bs4逐层比较标签内容
+            head_canonical_ids = {id(tag) for tag in head_canonical_tags}
+            # 只需要第一个位于<head>外的标签，找到即停止
+            first_outside_head_tag = next(
+                (tag for tag in all_canonical_tags if id(tag) not in head_canonical_ids), None
+            )
             
-            if outside_head_tags:
-                self.add_issue(
+            if first_outside_head_tag is not None:
+                add_issue(
                     "Canonicals",
                     "Outside <head>",
                     "有规范链接标签位于<head>标签外，这不符合HTML规范且可能不被搜索引擎识别。",
                     "high",
-                    affected_element=str(outside_head_tags[0])[:100] + ('...' if len(str(outside_head_tags[0])) > 100 else ''),
+                    affected_element=self.truncate_element(first_outside_head_tag),
                     issue_type="issues"
                 )
         
+        # 各规范链接的href只提取一次，供冲突检查和下方的详细分析共用
+        canonical_hrefs = [tag.get('href', '').strip() for tag in all_canonical_tags]
+        
         # 检查多个规范链接
         if len(all_canonical_tags) > 1:
-            self.add_issue(
+            add_issue(
                 "Canonicals",
                 "Multiple",
                 f"页面包含{len(all_canonical_tags)}个规范链接标签，应该只有一个。",
@@ -209,9 +382,8 @@ class LinkChecker(BaseChecker):
             )
             
             # 检查多个规范链接是否存在冲突（指向不同的URL）
-            canonical_hrefs = [tag.get('href', '').strip() for tag in all_canonical_tags]
             if len(set(canonical_hrefs)) > 1:
-                self.add_issue(
+                add_issue(
                     "Canonicals",
                     "Multiple Conflicting",
                     "页面包含指向不同URL的多个规范链接标签，这会使搜索引擎混淆。",
@@ -222,11 +394,11 @@ class LinkChecker(BaseChecker):
         
         # 获取第一个规范链接进行详细分析
         canonical_tag = all_canonical_tags[0]
-        canonical_href = canonical_tag.get('href', '').strip()
+        canonical_href = canonical_hrefs[0]
         
         # 检查规范链接是否为相对URL
         if canonical_href and not canonical_href.startswith(('http://', 'https://')):
-            self.add_issue(
+            add_issue(
                 "Canonicals",
                 "Canonical Is Relative",
                 "规范链接使用相对URL，最佳做法是使用绝对URL。",
@@ -236,7 +408,7 @@ class LinkChecker(BaseChecker):
         
         # 检查规范链接是否包含片段标识符（#）
         if '#' in canonical_href:
-            self.add_issue(
+            add_issue(
                 "Canonicals",
                 "Contains Fragment URL",
                 "规范链接包含片段标识符(#)，这可能导致规范化问题。搜索引擎通常会忽略URL中的片段部分。",
@@ -250,33 +422,35 @@ class LinkChecker(BaseChecker):
         invalid_attrs = [attr for attr in canonical_tag.attrs if attr.lower() not in valid_attributes]
         
         if invalid_attrs:
-            self.add_issue(
+            add_issue(
                 "Canonicals",
                 "Invalid Attribute In Annotation",
                 f"规范链接标签包含无效属性: {', '.join(invalid_attrs)}。这可能会影响规范链接的正确解析。",
                 "low",
-                affected_element=str(canonical_tag)[:100] + ('...' if len(str(canonical_tag)) > 100 else ''),
+                affected_element=self.truncate_element(canonical_tag),
                 issue_type="issues"
             )
     
     def check_pagination(self):
         """检查分页相关问题"""
+        add_issue = self.add_issue
+        tag_index = self._get_tag_index()
+        
         # 检查头部中的rel="next"和rel="prev"链接
-        head_next_links = self.soup.find_all('link', rel='next')
-        head_prev_links = self.soup.find_all('link', rel='prev')
+        head_next_links = tag_index['next']
+        head_prev_links = tag_index['prev']
         
         # 检查常见的分页链接模式，包括a标签中的分页链接
         # 使用常见的分页URL模式和类名进行检测
-        pagination_anchors = self.soup.find_all('a', href=re.compile(r'[?&](page|p)=\d+|/page/\d+|_page=\d+'))
-        pagination_anchors.extend(self.soup.find_all('a', class_=re.compile(r'pag|page')))
+        pagination_anchors = tag_index['pagination_href_anchors'] + tag_index['pagination_class_anchors']
         
         # 使用常见的分页导航容器查找
-        pagination_navs = self.soup.find_all(['nav', 'div'], class_=re.compile(r'pag|pagination'))
-        pagination_uls = self.soup.find_all('ul', class_=re.compile(r'pag|pagination'))
+        pagination_navs = tag_index['pagination_navs']
+        pagination_uls = tag_index['pagination_uls']
         
         # 1. 检查是否缺少规范链接标签
-        if (head_next_links or head_prev_links) and not self.soup.find('link', rel='canonical'):
-            self.add_issue(
+        if (head_next_links or head_prev_links) and not tag_index['canonical']:
+            add_issue(
                 "Pagination",
                 "Missing Canonical",
                 "分页页面应该有规范链接标签，以避免重复内容问题。",
@@ -285,9 +459,9 @@ class LinkChecker(BaseChecker):
             )
         
         # 2. 检查Non-Indexable - 分页页面是否被设置为不可索引
-        meta_robots = self.soup.find('meta', attrs={'name': 'robots'})
+        meta_robots = tag_index['meta_robots']
         if meta_robots and ('noindex' in meta_robots.get('content', '').lower()) and (head_next_links or head_prev_links or pagination_anchors):
-            self.add_issue(
+            add_issue(
                 "Pagination",
                 "Non-Indexable",
                 "分页页面被设置为noindex，这可能导致相关内容无法被索引。除非有明确的SEO策略，否则分页通常应保持可索引。",
@@ -296,41 +470,29 @@ class LinkChecker(BaseChecker):
             )
         
         # 提取当前页面和所有分页链接
-        all_pagination_urls = set()
         current_page_num = None
         
-        # 从URL中提取当前页码
-        if self.page_url:
-            current_page_match = re.search(r'[?&](page|p)=(\d+)|/page/(\d+)|_page=(\d+)', self.page_url)
+        # 从URL中提取当前页码（所有分页形式都含有"page"或"p="，不含时无需运行正则）
+        if self.page_url and ('page' in self.page_url or 'p=' in self.page_url):
+            current_page_match = PAGE_NUMBER_RE.search(self.page_url)
             if current_page_match:
-                # 提取匹配组中的数字
-                for group in current_page_match.groups():
-                    if group and group.isdigit():
-                        current_page_num = int(group)
-                        break
+                current_page_num = int(current_page_match.group(1))
         
-        # 从分页锚点收集所有分页URL和页码
+        # 从分页锚点收集所有分页URL（按文档顺序去重）和页码
+        all_pagination_urls = dict.fromkeys(
+            href for href in (anchor.get('href', '') for anchor in pagination_anchors)
+            if href and not href.startswith('#')
+        )
         page_numbers = {}
-        for anchor in pagination_anchors:
-            href = anchor.get('href', '')
-            if not href or href.startswith('#'):
-                continue
-                
-            all_pagination_urls.add(href)
-            
+        for href in all_pagination_urls:
             # 提取页码
-            page_match = re.search(r'[?&](page|p)=(\d+)|/page/(\d+)|_page=(\d+)', href)
+            page_match = PAGE_NUMBER_RE.search(href)
             if page_match:
-                # 提取匹配组中的数字
-                for group in page_match.groups():
-                    if group and group.isdigit():
-                        page_num = int(group)
-                        page_numbers[href] = page_num
-                        break
+                page_numbers[href] = int(page_match.group(1))
         
         # 3. Pagination URL Not In Anchor Tag - 如果头部有分页链接但页面中没有对应的a标签
         if (head_next_links or head_prev_links) and not pagination_anchors:
-            self.add_issue(
+            add_issue(
                 "Pagination",
                 "Pagination URL Not In Anchor Tag",
                 "页面头部有分页链接标记(rel=next/prev)，但在页面内容中没有找到对应的分页链接。用户无法通过可见导航浏览分页内容。",
@@ -339,14 +501,11 @@ class LinkChecker(BaseChecker):
             )
         
         # 4. Multiple Pagination URLs - 检查是否有重复指向同一页面的分页链接
-        page_counts = {}
-        for page_num in page_numbers.values():
-            page_counts[page_num] = page_counts.get(page_num, 0) + 1
-        
+        page_counts = Counter(page_numbers.values())
         duplicate_pages = {page: count for page, count in page_counts.items() if count > 1}
         if duplicate_pages:
             duplicates = ", ".join([f"页码{page}出现{count}次" for page, count in duplicate_pages.items()])
-            self.add_issue(
+            add_issue(
                 "Pagination",
                 "Multiple Pagination URLs",
                 f"检测到重复的分页链接: {duplicates}。这可能导致搜索引擎爬行预算浪费和用户体验问题。",
@@ -356,16 +515,19 @@ class LinkChecker(BaseChecker):
         
         # 5. 检查Sequence Error - 分页序列中的错误
         if page_numbers and len(page_numbers) >= 2:
-            # 获取所有页码并排序
-            page_nums = sorted(page_numbers.values())
+            # 获取所有不重复的页码并排序
+            page_nums = sorted(set(page_numbers.values()))
             
-            # 检查序列是否连续
-            expected_sequence = list(range(min(page_nums), max(page_nums) + 1))
-            missing_pages = set(expected_sequence) - set(page_nums)
+            # 检查序列是否连续：只枚举相邻页码之间的空缺，无需构造完整的期望序列
+            missing_pages = [
+                page
+                for prev_page, next_page in zip(page_nums, page_nums[1:])
+                for page in range(prev_page + 1, next_page)
+            ]
             
             if missing_pages:
-                missing_str = ", ".join(map(str, sorted(missing_pages)))
-                self.add_issue(
+                missing_str = ", ".join(map(str, missing_pages))
+                add_issue(
                     "Pagination",
                     "Sequence Error",
                     f"分页序列不完整，缺少页码: {missing_str}。这会使用户和搜索引擎无法访问所有内容。",
@@ -381,16 +543,11 @@ class LinkChecker(BaseChecker):
             # 检查头部的next/prev链接是否指向正确的页面
             if head_next_links:
                 next_href = head_next_links[0].get('href', '')
-                next_match = re.search(r'[?&](page|p)=(\d+)|/page/(\d+)|_page=(\d+)', next_href)
+                next_match = PAGE_NUMBER_RE.search(next_href)
                 if next_match:
-                    next_actual = None
-                    for group in next_match.groups():
-                        if group and group.isdigit():
-                            next_actual = int(group)
-                            break
-                    
-                    if next_actual is not None and next_actual != next_page_expected:
-                        self.add_issue(
+                    next_actual = int(next_match.group(1))
+                    if next_actual != next_page_expected:
+                        add_issue(
                             "Pagination",
                             "Pagination Loop",
                             f"当前页面为{current_page_num}，但next链接指向页面{next_actual}，而非预期的{next_page_expected}。这可能创建分页循环或跳跃，影响爬虫和用户。",
@@ -400,16 +557,11 @@ class LinkChecker(BaseChecker):
             
             if head_prev_links and prev_page_expected:
                 prev_href = head_prev_links[0].get('href', '')
-                prev_match = re.search(r'[?&](page|p)=(\d+)|/page/(\d+)|_page=(\d+)', prev_href)
+                prev_match = PAGE_NUMBER_RE.search(prev_href)
                 if prev_match:
-                    prev_actual = None
-                    for group in prev_match.groups():
-                        if group and group.isdigit():
-                            prev_actual = int(group)
-                            break
-                    
-                    if prev_actual is not None and prev_actual != prev_page_expected:
-                        self.add_issue(
+                    prev_actual = int(prev_match.group(1))
+                    if prev_actual != prev_page_expected:
+                        add_issue(
                             "Pagination",
                             "Pagination Loop",
                             f"当前页面为{current_page_num}，但prev链接指向页面{prev_actual}，而非预期的{prev_page_expected}。这可能创建分页循环，影响爬虫和用户。",
@@ -434,7 +586,7 @@ class LinkChecker(BaseChecker):
             if page_numbers and current_page_num is not None:
                 max_page = max(page_numbers.values())
                 if current_page_num < max_page:
-                    self.add_issue(
+                    add_issue(
                         "Pagination",
                         "Unlinked Pagination URLs",
                         "发现分页导航，但缺少\"下一页\"按钮或链接，这会使用户难以浏览所有内容页面。",
@@ -444,8 +596,8 @@ class LinkChecker(BaseChecker):
         
         # 8. 检查明显的Non-200 Pagination URLs (静态分析无法检查HTTP状态码，但可以检查明显无效的URL)
         for url in all_pagination_urls:
-            if url.startswith(('javascript:', 'void(', '#')) or url.endswith(('.jpg', '.png', '.gif', '.pdf')):
-                self.add_issue(
+            if INVALID_PAGINATION_URL_RE.search(url):
+                add_issue(
                     "Pagination",
                     "Non-200 Pagination URLs",
                     f"发现可能无效的分页URL: {url}。分页链接应指向有效的HTML页面。",
@@ -456,35 +608,38 @@ class LinkChecker(BaseChecker):
     
     def check_hreflang(self):
         """检查hreflang相关问题"""
-        # 导入优化后的验证函数
-        from app.core.seo.utils.hreflang_utils import get_hreflang_validation_result, validate_hreflang_list
+        add_issue = self.add_issue
+        tag_index = self._get_tag_index()
         
         # 查找所有hreflang标签
-        all_hreflang_tags = self.soup.find_all('link', attrs={'rel': 'alternate', 'hreflang': True})
+        all_hreflang_tags = tag_index['hreflang']
         
         if not all_hreflang_tags:
             return  # 没有hreflang标签，不需要检查
         
-        # 检查hreflang标签是否在<head>内
-        head_tag = self.soup.find('head')
-        if head_tag:
-            head_hreflang_tags = head_tag.find_all('link', attrs={'rel': 'alternate', 'hreflang': True})
-            outside_head_tags = [tag for tag in all_hreflang_tags if tag not in head_hreflang_tags]
+        # 导入优化后的验证函数
+        from app.core.seo.utils.hreflang_utils import get_hreflang_validation_result, validate_hreflang_list
+        
+        # 检查hreflang标签是否在<head>内（全部位于<head>内时无需逐个比对）
+        if tag_index['head'] and len(tag_index['head_hreflang']) < len(all_hreflang_tags):
+            head_hreflang_tags = tag_index['head_hreflang']
+            # 按对象身份比较，避免bs4逐层比较标签内容
+            head_hreflang_ids = {id(tag) for tag in head_hreflang_tags}
+            outside_head_tags = [tag for tag in all_hreflang_tags if id(tag) not in head_hreflang_ids]
             
             if outside_head_tags:
-                self.add_issue(
+                add_issue(
                     "Hreflang",
                     "Outside <head>",
                     f"有{len(outside_head_tags)}个hreflang标签位于<head>标签外，这些标签可能不会被搜索引擎正确识别。",
                     "high",
-                    affected_element=str(outside_head_tags[0])[:100] + ('...' if len(str(outside_head_tags[0])) > 100 else ''),
+                    affected_element=self.truncate_element(outside_head_tags[0]),
                     issue_type="issues"
                 )
         
         # 检查是否使用了规范链接
-        canonical_tag = self.soup.find('link', rel='canonical')
-        if not canonical_tag:
-            self.add_issue(
+        if not tag_index['canonical']:
+            add_issue(
                 "Hreflang",
                 "Not Using Canonical",
                 "使用hreflang的页面应该也使用canonical标签，以避免重复内容问题。",
@@ -494,7 +649,7 @@ class LinkChecker(BaseChecker):
         
         # 检查是否有x-default
         if not any(tag.get('hreflang') == 'x-default' for tag in all_hreflang_tags):
-            self.add_issue(
+            add_issue(
                 "Hreflang",
                 "Missing X-Default",
                 "使用hreflang时建议包含x-default标签，用于不匹配任何语言的用户。",
@@ -520,12 +675,12 @@ class LinkChecker(BaseChecker):
                     first_invalid_tag = tag
                     break
             
-            self.add_issue(
+            add_issue(
                 "Hreflang",
                 "Invalid Language & Region Codes",
                 f"检测到{len(validation_results['invalid'])}个无效的hreflang值：{example_text}。请使用有效的ISO语言代码（如'en'、'zh'）和区域代码（如'US'、'CN'），或使用'x-default'。",
                 "high",
-                affected_element=str(first_invalid_tag)[:100] + ('...' if len(str(first_invalid_tag)) > 100 else '') if first_invalid_tag else None,
+                affected_element=self.truncate_element(first_invalid_tag),
                 issue_type="issues"
             )
         
@@ -547,25 +702,21 @@ class LinkChecker(BaseChecker):
                     first_non_standard_tag = tag
                     break
             
-            self.add_issue(
+            add_issue(
                 "Hreflang",
                 "Non-Standard Format",
                 f"检测到{len(validation_results['valid_non_standard'])}个hreflang值使用了非标准格式。虽然这些值有效，但建议使用标准格式（语言代码小写，区域代码大写）以确保最佳兼容性{example_text}。",
                 "low",
-                affected_element=str(first_non_standard_tag)[:100] + ('...' if len(str(first_non_standard_tag)) > 100 else '') if first_non_standard_tag else None,
+                affected_element=self.truncate_element(first_non_standard_tag),
                 issue_type="opportunities"
             )
         
         # 检查重复的hreflang条目
         if validation_results['duplicates']:
             # 统计每个重复值的出现次数
-            duplicate_counts = {}
-            for code in hreflang_codes:
-                if code in validation_results['duplicates']:
-                    duplicate_counts[code] = hreflang_codes.count(code)
-            
-            duplicate_list = [f"'{code}'({count}次)" for code, count in duplicate_counts.items()]
-            self.add_issue(
+            code_counts = Counter(hreflang_codes)
+            duplicate_list = [f"'{code}'({count}次)" for code, count in code_counts.items() if count > 1]
+            add_issue(
                 "Hreflang",
                 "Multiple Entries",
                 f"存在重复的hreflang条目: {', '.join(duplicate_list)}。每种语言和区域组合应该只有一个hreflang条目。",
@@ -575,27 +726,22 @@ class LinkChecker(BaseChecker):
         
         # 检查是否有自引用
         if self.page_url:
+            # 页面URL和各标签的href只去除一次末尾斜杠，两轮查找共用结果
+            page_url_norm = self.page_url.rstrip('/')
+            self_url_tags = [
+                tag for tag in all_hreflang_tags
+                if tag.get('href') and tag.get('href').rstrip('/') == page_url_norm
+            ]
+            
             # 尝试找到当前页面对应的hreflang值
-            current_page_lang = None
-            for tag in all_hreflang_tags:
-                href = tag.get('href', '')
-                if href == self.page_url or (href and self.page_url and href.rstrip('/') == self.page_url.rstrip('/')):
-                    current_page_lang = tag.get('hreflang')
-                    break
+            current_page_lang = self_url_tags[0].get('hreflang') if self_url_tags else None
             
             # 如果找到了当前页面的语言但没有相应的自引用
             if current_page_lang:
-                has_self_reference = False
-                for tag in all_hreflang_tags:
-                    if tag.get('hreflang') == current_page_lang and (
-                        tag.get('href') == self.page_url or 
-                        (tag.get('href') and self.page_url and tag.get('href').rstrip('/') == self.page_url.rstrip('/'))
-                    ):
-                        has_self_reference = True
-                        break
+                has_self_reference = any(tag.get('hreflang') == current_page_lang for tag in self_url_tags)
                 
                 if not has_self_reference:
-                    self.add_issue(
+                    add_issue(
                         "Hreflang",
                         "Missing Self Reference",
                         f"当前页面的语言代码 '{current_page_lang}' 没有在hreflang标签中自我引用。",
@@ -607,12 +753,12 @@ class LinkChecker(BaseChecker):
         for tag in all_hreflang_tags:
             href = tag.get('href', '')
             if not href or href.strip() == '':
-                self.add_issue(
+                add_issue(
                     "Hreflang",
                     "Unlinked Hreflang URLs",
                     "存在href属性为空的hreflang标签，这些标签不会被搜索引擎识别。",
                     "high",
-                    affected_element=str(tag)[:100] + ('...' if len(str(tag)) > 100 else ''),
+                    affected_element=self.truncate_element(tag),
                     issue_type="issues"
                 )
                 break  # 只报告一次
\ No newline at end of file
@@ -1,12 +1,103 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from itertools import islice
 import re
+from bs4 import BeautifulSoup, Tag
 from .base_checker import BaseChecker
 
+HEADING_LEVELS = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+HEADING_TAG_NAMES = frozenset(HEADING_LEVELS)
+
+
+def _group_ascii_widths(width_of) -> List[tuple]:
+    """
+    按宽度把ASCII字符分组，返回[(宽度, 不属于该组的全部字节)]，
+    用bytes.translate删除其他字节后即可得到该组字符数量
+    """
+    groups = {}
+    for code in range(128):
+        groups.setdefault(width_of(chr(code)), set()).add(code)
+    return [
+        (width, bytes(code for code in range(128) if code not in codes))
+        for width, codes in groups.items()
+    ]
+
+
+# 元描述：空白3px，其他ASCII字符(英文字母、数字、标点)7px，非ASCII字符(如中文、日文等)14px
+DESCRIPTION_ASCII_WIDTHS = _group_ascii_widths(lambda char: 3 if char.isspace() else 7)
+DESCRIPTION_NON_ASCII_WIDTH = 14
+
+# 标题：英文字母14px，数字13px，其他字符(包括中文、标点等)20px
+TITLE_ASCII_WIDTHS = _group_ascii_widths(lambda char: 14 if char.isalpha() else 13 if char.isdigit() else 20)
+TITLE_NON_ASCII_WIDTH = 20
+TITLE_NON_ASCII_DIGIT_WIDTH = 13
+
+# str.translate用：删除全部ASCII字符，只保留非ASCII部分
+STRIP_ASCII_TABLE = dict.fromkeys(range(128))
+
+
+def has_duplicates(values) -> bool:
+    """判断序列中是否有重复值，遇到第一个重复即返回"""
+    seen = set()
+    for value in values:
+        if value in seen:
+            return True
+        seen.add(value)
+    return False
+
+
+def estimate_weighted_width(text: str, ascii_widths: List[tuple], non_ascii_width: int,
+                            non_ascii_digit_width: Optional[int] = None) -> int:
+    """
+    按字符类别估算文本像素宽度：各类别计数后加权求和，避免逐字符的Python循环。
+    non_ascii_digit_width不为空时，str.isdigit()为真的非ASCII字符按该宽度计算
+    """
+    if not text:
+        return 0
+    
+    ascii_bytes = text.encode('ascii', 'ignore')
+    non_ascii_count = len(text) - len(ascii_bytes)
+    
+    width = sum(width * len(ascii_bytes.translate(None, others)) for width, others in ascii_widths)
+    
+    if non_ascii_count:
+        non_ascii_digits = 0
+        if non_ascii_digit_width is not None:
+            non_ascii_digits = sum(map(str.isdigit, text.translate(STRIP_ASCII_TABLE)))
+            width += non_ascii_digits * non_ascii_digit_width
+        width += (non_ascii_count - non_ascii_digits) * non_ascii_width
+    
+    return width
+
+
+# 需要检查的robots meta名称（不区分大小写）
+ROBOTS_META_NAMES = frozenset(['robots', 'googlebot'])
+
+# robots指令相关正则，模块加载时编译一次
+UNAVAILABLE_AFTER_RE = re.compile(r'unavailable_after:\s*(.*)')
+
+# robots指令及其对应的问题：(指令, (分类, 问题名称, 描述, 优先级, 问题类型))，按报告顺序排列
+ROBOTS_DIRECTIVE_ISSUES = [
+    ('noimageindex', ("Robots Directives", "NoImageIndex", "页面使用了noimageindex指令，这将阻止搜索引擎索引页面上的图片。", "high", "issues")),
+    ('noindex', ("Robots Directives", "Noindex", "页面使用了noindex指令，这将阻止搜索引擎索引此页面。确保这是有意的设置。", "high", "warnings")),
+    ('nofollow', ("Robots Directives", "Nofollow", "页面使用了nofollow指令，这将阻止搜索引擎跟踪此页面上的链接。确保这是有意的设置。", "medium", "warnings")),
+    ('none', ("Robots Directives", "None", "页面使用了none指令，这等同于同时使用noindex和nofollow，将阻止页面被索引和链接被跟踪。", "high", "warnings")),
+    ('unavailable_after', ("Robots Directives", "Unavailable_After", "页面设置了在{date_str}后不可用。到该日期后，搜索引擎将不再索引此页面。", "medium", "warnings")),
+    ('nosnippet', ("Robots Directives", "NoSnippet", "页面使用了nosnippet指令，这将阻止搜索引擎在搜索结果中显示页面摘要。", "low", "warnings")),
+    ('noodp', ("Robots Directives", "NoODP", "页面使用了noodp指令，这将阻止搜索引擎使用开放目录项目(ODP)的描述。", "low", "warnings")),
+    ('noydir', ("Robots Directives", "NoYDIR", "页面使用了noydir指令，这将阻止搜索引擎使用Yahoo目录的描述。注意，此指令已过时。", "low", "warnings")),
+    ('notranslate', ("Robots Directives", "NoTranslate", "页面使用了notranslate指令，这将阻止搜索引擎在搜索结果中提供此页面的翻译。", "low", "warnings")),
+]
+
 class MetaChecker(BaseChecker):
     """检查页面元数据相关的SEO问题"""
     
+    def __init__(self, soup: BeautifulSoup, page_url: Optional[str] = None):
+        super().__init__(soup, page_url)
+        self._tag_index = None
+    
     def check(self) -> Dict[str, List[Dict[str, Any]]]:
         """执行所有元数据相关检查"""
+        self._get_tag_index()
         self.check_page_titles()
         self.check_meta_description()
         self.check_h1()
@@ -16,28 +107,83 @@ class MetaChecker(BaseChecker):
         
         return self.get_issues()
     
-    def estimate_pixel_width(self, text: str) -> int:
-        if not text:
-            return 0
+    def _get_tag_index(self) -> Dict[str, Any]:
+        """
+        遍历一次文档树，按标签名收集title、标题和meta等元素，
+        并记录哪些位于<head>内，避免各检查方法重复调用find_all
+        """
+        if self._tag_index is not None:
+            return self._tag_index
+        
+        index = {
+            'head': None,
+            'title': [],
+            'head_title': [],
+            'headings': [],
+            'h1': [],
+            'h2': [],
+            'description': [],
+            'head_description': [],
+            'robots_meta': [],
+            'head_robots_meta': [],
+        }
+        def in_head(el) -> bool:
+            head = index['head']
+            return head is not None and any(parent is head for parent in el.parents)
+        
+        for el in self.get_all_tags():
+            name = el.name
             
-        pixel_width = 0
-        for char in text:
-            if ord(char) > 127:  # 非ASCII字符(如中文、日文等)
-                pixel_width += 14
-            elif char.isspace():  # 空格
-                pixel_width += 3
-            else:  # ASCII字符(英文字母、数字、标点)
-                pixel_width += 7
-                
-        return pixel_width
+            if name in HEADING_TAG_NAMES:
+                index['headings'].append(el)
+                if name == 'h1' or name == 'h2':
+                    index[name].append(el)
+            
+            elif name == 'meta':
+                meta_name = el.attrs.get('name')
+                if meta_name is None:
+                    continue
+                if meta_name == 'description':
+                    index['description'].append(el)
+                    if in_head(el):
+                        index['head_description'].append(el)
+                if meta_name.lower() in ROBOTS_META_NAMES:
+                    index['robots_meta'].append(el)
+                    if in_head(el):
+                        index['head_robots_meta'].append(el)
+            
+            elif name == 'title':
+                index['title'].append(el)
+                if in_head(el):
+                    index['head_title'].append(el)
+            
+            elif name == 'head':
+                if index['head'] is None:
+                    index['head'] = el
+        
+        self._tag_index = index
+        return index
+    
+    def _get_heading_texts(self, name: str) -> List[str]:
+        """返回指定级别标题去除首尾空白后的文本，计算一次后缓存复用"""
+        tag_index = self._get_tag_index()
+        key = name + '_texts'
+        if key not in tag_index:
+            tag_index[key] = [tag.text.strip() for tag in tag_index[name]]
+        return tag_index[key]
+    
+    def estimate_pixel_width(self, text: str) -> int:
+        return estimate_weighted_width(text, DESCRIPTION_ASCII_WIDTHS, DESCRIPTION_NON_ASCII_WIDTH)
     
     def check_page_titles(self):
         """检查页面标题相关问题"""
-        titles = self.soup.find_all('title')
+        add_issue = self.add_issue
+        tag_index = self._get_tag_index()
+        titles = tag_index['title']
         
         # 检查title标签是否存在
         if not titles:
-            self.add_issue(
+            add_issue(
                 category="Page Titles",
                 issue="Missing",
                 description="页面缺少<title>标签，这是SEO的基本要求。",
@@ -48,7 +194,7 @@ class MetaChecker(BaseChecker):
         
         # 检查多个title标签
         if len(titles) > 1:
-            self.add_issue(
+            add_issue(
                 category="Page Titles",
                 issue="Multiple",
                 description=f"页面包含{len(titles)}个<title>标签，应该只有一个。",
@@ -57,13 +203,12 @@ class MetaChecker(BaseChecker):
             )
         
         # 检查title标签是否在head内
-        head_tag = self.soup.find('head')
         title_in_head = False
         
-        if head_tag:
-            head_titles = head_tag.find_all('title')
+        if tag_index['head']:
+            head_titles = tag_index['head_title']
             if not head_titles or len(head_titles) != len(titles):
-                self.add_issue(
+                add_issue(
                     category="Page Titles",
                     issue="Outside <head>",
                     description="页面的<title>标签应该位于<head>元素内。",
@@ -78,7 +223,7 @@ class MetaChecker(BaseChecker):
         
         # 检查title字符长度
         if len(title) > 60:
-            self.add_issue(
+            add_issue(
                 category="Page Titles",
                 issue="Over 60 Characters",
                 description=f"标题长度为{len(title)}个字符，超过了60个字符的建议长度。",
@@ -86,7 +231,7 @@ class MetaChecker(BaseChecker):
                 issue_type="opportunities"
             )
         elif len(title) < 30 and len(title) > 0:
-            self.add_issue(
+            add_issue(
                 category="Page Titles",
                 issue="Below 30 Characters",
                 description=f"标题长度为{len(title)}个字符，低于30个字符的建议最小长度。",
@@ -96,18 +241,13 @@ class MetaChecker(BaseChecker):
         
         # 估算标题的像素宽度
         # 这是一个启发式估算，假设平均每个英文字符14px，数字13px，其他字符20px
-        pixel_width = 0
-        for char in title:
-            if char.isalpha() and ord(char) < 128:  # 英文字母
-                pixel_width += 14
-            elif char.isdigit():  # 数字
-                pixel_width += 13
-            else:  # 其他字符(包括中文、标点等)
-                pixel_width += 20
+        pixel_width = estimate_weighted_width(
+            title, TITLE_ASCII_WIDTHS, TITLE_NON_ASCII_WIDTH, TITLE_NON_ASCII_DIGIT_WIDTH
+        )
         
         # 检查像素宽度
         if pixel_width > 561:
-            self.add_issue(
+            add_issue(
                 category="Page Titles",
                 issue="Over 561 Pixels",
                 description=f"标题估计宽度约为{pixel_width}像素，超过了561像素的建议最大宽度。这可能导致在搜索结果中被截断。",
@@ -115,7 +255,7 @@ class MetaChecker(BaseChecker):
                 issue_type="opportunities"
             )
         elif pixel_width < 200:
-            self.add_issue(
+            add_issue(
                 category="Page Titles",
                 issue="Below 200 Pixels",
                 description=f"标题估计宽度约为{pixel_width}像素，低于200像素的建议最小宽度。标题可能过短，未充分利用展示空间。",
@@ -124,9 +264,9 @@ class MetaChecker(BaseChecker):
             )
         
         # 检查title是否与h1相同
-        h1_tags = self.soup.find_all('h1')
-        if h1_tags and title == h1_tags[0].text.strip():
-            self.add_issue(
+        h1_tags = tag_index['h1']
+        if h1_tags and title == self._get_heading_texts('h1')[0]:
+            add_issue(
                 category="Page Titles",
                 issue="Same as H1",
                 description="页面标题与H1标题完全相同，建议适当区分以提供更多信息。",
@@ -136,12 +276,15 @@ class MetaChecker(BaseChecker):
 
     def check_meta_description(self):
         """检查元描述相关问题"""
+        add_issue = self.add_issue
+        tag_index = self._get_tag_index()
+        
         # 查找所有元描述标签，不限于位置
-        all_descriptions = self.soup.find_all('meta', attrs={'name': 'description'})
+        all_descriptions = tag_index['description']
         
         # 检查是否存在元描述
         if not all_descriptions:
-            self.add_issue(
+            add_issue(
                 category="Meta Description",
                 issue="Missing",
                 description="页面缺少元描述标签，这可能影响搜索结果中的显示内容。",
@@ -152,7 +295,7 @@ class MetaChecker(BaseChecker):
         
         # 检查多个元描述
         if len(all_descriptions) > 1:
-            self.add_issue(
+            add_issue(
                 category="Meta Description",
                 issue="Multiple",
                 description=f"页面包含{len(all_descriptions)}个元描述标签，应该只有一个。",
@@ -161,18 +304,19 @@ class MetaChecker(BaseChecker):
             )
         
         # 检查元描述是否位于head标签内
-        head_tag = self.soup.find('head')
-        if head_tag:
-            head_descriptions = head_tag.find_all('meta', attrs={'name': 'description'})
+        if tag_index['head']:
+            head_descriptions = tag_index['head_description']
             if len(head_descriptions) < len(all_descriptions):
                 # 有些元描述标签不在head内
-                outside_head = [desc for desc in all_descriptions if desc not in head_descriptions]
-                self.add_issue(
+                # 按对象身份比较，避免bs4逐层比较标签内容
+                head_description_ids = {id(desc) for desc in head_descriptions}
+                outside_head = [desc for desc in all_descriptions if id(desc) not in head_description_ids]
+                add_issue(
                     category="Meta Description",
                     issue="Outside <head>",
                     description="有元描述标签位于<head>标签外，这不符合HTML规范且可能不被搜索引擎识别。",
                     priority="high",
-                    affected_element=str(outside_head[0])[:100] + ('...' if len(str(outside_head[0])) > 100 else ''),
+                    affected_element=self.truncate_element(outside_head[0]),
                     issue_type="issues"
                 )
         
@@ -182,7 +326,7 @@ class MetaChecker(BaseChecker):
         
         # 字符长度检查
         if len(description) > 155:
-            self.add_issue(
+            add_issue(
                 category="Meta Description",
                 issue="Over 155 Characters",
                 description=f"元描述长度为{len(description)}个字符，超过了155个字符的建议长度。",
@@ -190,7 +334,7 @@ class MetaChecker(BaseChecker):
                 issue_type="opportunities"
             )
         elif len(description) < 70 and len(description) > 0:
-            self.add_issue(
+            add_issue(
                 category="Meta Description",
                 issue="Below 70 Characters",
                 description=f"元描述长度为{len(description)}个字符，低于70个字符的建议最小长度。",
@@ -203,7 +347,7 @@ class MetaChecker(BaseChecker):
         
         # 像素宽度检查
         if estimated_pixel_width > 985:
-            self.add_issue(
+            add_issue(
                 category="Meta Description",
                 issue="Over 985 Pixels",
                 description=f"元描述估计宽度约为{estimated_pixel_width}像素，超过985像素可能在搜索结果中被截断。",
@@ -211,7 +355,7 @@ class MetaChecker(BaseChecker):
                 issue_type="opportunities"
             )
         elif estimated_pixel_width < 400 and len(description) > 0:
-            self.add_issue(
+            add_issue(
                 category="Meta Description",
                 issue="Below 400 Pixels",
                 description=f"元描述估计宽度约为{estimated_pixel_width}像素，短于400像素可能未充分利用搜索结果展示空间。",
@@ -221,11 +365,12 @@ class MetaChecker(BaseChecker):
 
     def check_h1(self):
         """检查H1标题相关问题"""
-        h1_tags = self.soup.find_all('h1')
+        add_issue = self.add_issue
+        h1_tags = self._get_tag_index()['h1']
         
         # 检查是否存在H1标签
         if not h1_tags:
-            self.add_issue(
+            add_issue(
                 category="H1",
                 issue="Missing",
                 description="页面缺少H1标题标签，这是SEO的重要因素。",
@@ -236,7 +381,7 @@ class MetaChecker(BaseChecker):
         
         # 检查多个H1标签
         if len(h1_tags) > 1:
-            self.add_issue(
+            add_issue(
                 category="H1",
                 issue="Multiple",
                 description=f"页面包含{len(h1_tags)}个H1标签，建议只使用一个主要H1标签。",
@@ -244,23 +389,24 @@ class MetaChecker(BaseChecker):
                 issue_type="warnings"
             )
         
-        # 检查H1中是否包含图片或其他非文本元素
+        # 检查H1中是否包含图片或其他非文本元素（图片也是元素，只需看是否有元素子节点）
         for h1 in h1_tags:
-            if h1.find('img') or len(h1.find_all()) > 0:
-                self.add_issue(
+            if any(isinstance(child, Tag) for child in h1.children):
+                add_issue(
                     category="H1",
                     issue="Alt Text in h1",
                     description="H1标签中包含图片或其他HTML元素，这不是SEO的最佳实践。H1应该是纯文本。",
                     priority="medium",
-                    affected_element=str(h1)[:100] + ('...' if len(str(h1)) > 100 else ''),
+                    affected_element=self.truncate_element(h1),
                     issue_type="warnings"
                 )
                 break  # 只报告一次
         
         # 检查H1长度
-        h1_text = h1_tags[0].text.strip()
+        h1_texts = self._get_heading_texts('h1')
+        h1_text = h1_texts[0]
         if len(h1_text) > 70:
-            self.add_issue(
+            add_issue(
                 category="H1",
                 issue="Over 70 Characters",
                 description=f"H1标题长度为{len(h1_text)}个字符，超过了70个字符的建议长度。",
@@ -270,9 +416,8 @@ class MetaChecker(BaseChecker):
         
         # 检查重复的H1内容
         if len(h1_tags) > 1:
-            h1_texts = [tag.text.strip() for tag in h1_tags]
-            if len(set(h1_texts)) < len(h1_texts):
-                self.add_issue(
+            if has_duplicates(h1_texts):
+                add_issue(
                     category="H1",
                     issue="Duplicate",
                     description="页面包含内容重复的H1标签。",
@@ -283,35 +428,22 @@ class MetaChecker(BaseChecker):
     def check_heading_hierarchy(self):
         """检查标题层级结构是否顺序合理"""
         # 获取所有标题标签
-        all_headings = self.soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+        all_headings = self._get_tag_index()['headings']
         
         # 如果少于2个标题，则不需要检查顺序
         if len(all_headings) < 2:
             return
         
         # 记录标题顺序
-        heading_sequence = []
-        for heading in all_headings:
-            heading_level = int(heading.name[1])  # 提取h1, h2, h3等中的数字
-            heading_sequence.append(heading_level)
-        
-        # 检查顺序问题
-        has_sequence_issue = False
-        
-        # 检查第一个标题是否为h1
-        if heading_sequence[0] != 1:
-            has_sequence_issue = True
-        
-        # 检查是否有跳跃超过一级的情况
-        for i in range(1, len(heading_sequence)):
-            curr_level = heading_sequence[i]
-            prev_level = heading_sequence[i-1]
-            
-            # 不允许的跳级: h1->h3, h1->h4等跳过中间级别
-            # 不允许的逆序: h1->h3->h2等不符合层级的顺序
-            if curr_level > prev_level + 1 or (prev_level > 1 and curr_level < prev_level - 1):
-                has_sequence_issue = True
-                break
+        heading_sequence = [HEADING_LEVELS[heading.name] for heading in all_headings]
+        
+        # 检查顺序问题：第一个标题必须为h1，且相邻标题之间不能跳级或逆序
+        # 不允许的跳级: h1->h3, h1->h4等跳过中间级别
+        # 不允许的逆序: h1->h3->h2等不符合层级的顺序
+        has_sequence_issue = heading_sequence[0] != 1 or any(
+            curr_level > prev_level + 1 or (prev_level > 1 and curr_level < prev_level - 1)
+            for prev_level, curr_level in zip(heading_sequence, islice(heading_sequence, 1, None))
+        )
         
         if has_sequence_issue:
             self.add_issue(
@@ -324,11 +456,12 @@ class MetaChecker(BaseChecker):
 
     def check_h2(self):
         """检查H2标题相关问题"""
-        h2_tags = self.soup.find_all('h2')
+        add_issue = self.add_issue
+        h2_tags = self._get_tag_index()['h2']
         
         # 检查是否存在H2标签
         if not h2_tags:
-            self.add_issue(
+            add_issue(
                 category="H2",
                 issue="Missing",
                 description="页面缺少H2标题标签，这可能影响内容结构化。",
@@ -337,11 +470,12 @@ class MetaChecker(BaseChecker):
             )
             return
         
+        h2_texts = self._get_heading_texts('h2')
+        
         # 检查H2长度
-        for h2 in h2_tags:
-            h2_text = h2.text.strip()
+        for h2_text in h2_texts:
             if len(h2_text) > 70:
-                self.add_issue(
+                add_issue(
                     category="H2",
                     issue="Over 70 Characters",
                     description=f"H2标题长度为{len(h2_text)}个字符，超过了70个字符的建议长度。",
@@ -351,9 +485,8 @@ class MetaChecker(BaseChecker):
                 break  # 只报告一次
         
         # 检查重复的H2内容
-        h2_texts = [tag.text.strip() for tag in h2_tags]
-        if len(set(h2_texts)) < len(h2_texts):
-            self.add_issue(
+        if has_duplicates(h2_texts):
+            add_issue(
                 category="H2",
                 issue="Duplicate",
                 description="页面包含内容重复的H2标签。",
@@ -363,19 +496,21 @@ class MetaChecker(BaseChecker):
 
     def check_robots_directives(self):
         """检查robots指令相关问题"""
-        import re
+        add_issue_spec = self.add_issue_spec
+        tag_index = self._get_tag_index()
         
         # 查找所有robots meta标签
-        all_robots_meta = self.soup.find_all('meta', attrs={'name': re.compile('^robots$|^googlebot$', re.I)})
+        all_robots_meta = tag_index['robots_meta']
         
         if not all_robots_meta:
             return  # 没有robots标签，不需要进一步检查
         
         # 检查robots meta标签是否在head标签内
-        head_tag = self.soup.find('head')
-        if head_tag:
-            head_robots_meta = head_tag.find_all('meta', attrs={'name': re.compile('^robots$|^googlebot$', re.I)})
-            outside_head_tags = [tag for tag in all_robots_meta if tag not in head_robots_meta]
+        if tag_index['head']:
+            head_robots_meta = tag_index['head_robots_meta']
+            # 按对象身份比较，避免bs4逐层比较标签内容
+            head_robots_meta_ids = {id(tag) for tag in head_robots_meta}
+            outside_head_tags = [tag for tag in all_robots_meta if id(tag) not in head_robots_meta_ids]
             
             if outside_head_tags:
                 self.add_issue(
@@ -383,112 +518,28 @@ class MetaChecker(BaseChecker):
                     issue="Outside <head>",
                     description="有robots meta标签位于<head>标签外，这不符合HTML规范且可能不被搜索引擎识别。",
                     priority="high",
-                    affected_element=str(outside_head_tags[0])[:100] + ('...' if len(str(outside_head_tags[0])) > 100 else ''),
+                    affected_element=self.truncate_element(outside_head_tags[0]),
                     issue_type="issues"
                 )
         
         # 分析所有robots meta标签的内容
         for meta in all_robots_meta:
             content = meta.get('content', '').lower()
-            directives = [directive.strip() for directive in content.split(',')]
-            
-            # 检查NoImageIndex指令
-            if 'noimageindex' in directives:
-                self.add_issue(
-                    category="Robots Directives",
-                    issue="NoImageIndex",
-                    description="页面使用了noimageindex指令，这将阻止搜索引擎索引页面上的图片。",
-                    priority="high",
-                    affected_element=str(meta)[:100] + ('...' if len(str(meta)) > 100 else ''),
-                    issue_type="issues"
-                )
-            
-            # 检查Noindex指令
-            if 'noindex' in directives:
-                self.add_issue(
-                    category="Robots Directives",
-                    issue="Noindex",
-                    description="页面使用了noindex指令，这将阻止搜索引擎索引此页面。确保这是有意的设置。",
-                    priority="high",
-                    affected_element=str(meta)[:100] + ('...' if len(str(meta)) > 100 else ''),
-                    issue_type="warnings"
-                )
-            
-            # 检查Nofollow指令
-            if 'nofollow' in directives:
-                self.add_issue(
-                    category="Robots Directives",
-                    issue="Nofollow",
-                    description="页面使用了nofollow指令，这将阻止搜索引擎跟踪此页面上的链接。确保这是有意的设置。",
-                    priority="medium",
-                    affected_element=str(meta)[:100] + ('...' if len(str(meta)) > 100 else ''),
-                    issue_type="warnings"
-                )
-            
-            # 检查None指令
-            if 'none' in directives:
-                self.add_issue(
-                    category="Robots Directives",
-                    issue="None",
-                    description="页面使用了none指令，这等同于同时使用noindex和nofollow，将阻止页面被索引和链接被跟踪。",
-                    priority="high",
-                    affected_element=str(meta)[:100] + ('...' if len(str(meta)) > 100 else ''),
-                    issue_type="warnings"
-                )
-            
-            # 检查Unavailable_After指令
-            unavailable_match = re.search(r'unavailable_after:\s*(.*)', content)
-            if unavailable_match:
-                date_str = unavailable_match.group(1)
-                self.add_issue(
-                    category="Robots Directives",
-                    issue="Unavailable_After",
-                    description=f"页面设置了在{date_str}后不可用。到该日期后，搜索引擎将不再索引此页面。",
-                    priority="medium",
-                    affected_element=str(meta)[:100] + ('...' if len(str(meta)) > 100 else ''),
-                    issue_type="warnings"
-                )
-            
-            # 检查NoSnippet指令
-            if 'nosnippet' in directives:
-                self.add_issue(
-                    category="Robots Directives",
-                    issue="NoSnippet",
-                    description="页面使用了nosnippet指令，这将阻止搜索引擎在搜索结果中显示页面摘要。",
-                    priority="low",
-                    affected_element=str(meta)[:100] + ('...' if len(str(meta)) > 100 else ''),
-                    issue_type="warnings"
-                )
+            directives = frozenset(directive.strip() for directive in content.split(','))
+            affected_element = None  # 同一标签的截断字符串只生成一次
             
-            # 检查NoODP指令
-            if 'noodp' in directives:
-                self.add_issue(
-                    category="Robots Directives",
-                    issue="NoODP",
-                    description="页面使用了noodp指令，这将阻止搜索引擎使用开放目录项目(ODP)的描述。",
-                    priority="low",
-                    affected_element=str(meta)[:100] + ('...' if len(str(meta)) > 100 else ''),
-                    issue_type="warnings"
-                )
-            
-            # 检查NoYDIR指令
-            if 'noydir' in directives:
-                self.add_issue(
-                    category="Robots Directives",
-                    issue="NoYDIR",
-                    description="页面使用了noydir指令，这将阻止搜索引擎使用Yahoo目录的描述。注意，此指令已过时。",
-                    priority="low",
-                    affected_element=str(meta)[:100] + ('...' if len(str(meta)) > 100 else ''),
-                    issue_type="warnings"
-                )
-            
-            # 检查NoTranslate指令
-            if 'notranslate' in directives:
-                self.add_issue(
-                    category="Robots Directives",
-                    issue="NoTranslate",
-                    description="页面使用了notranslate指令，这将阻止搜索引擎在搜索结果中提供此页面的翻译。",
-                    priority="low",
-                    affected_element=str(meta)[:100] + ('...' if len(str(meta)) > 100 else ''),
-                    issue_type="warnings"
-                )
\ No newline at end of file
+            for directive, issue_spec in ROBOTS_DIRECTIVE_ISSUES:
+                if directive == 'unavailable_after':
+                    # 检查Unavailable_After指令（带日期参数，需要用正则提取）
+                    unavailable_match = UNAVAILABLE_AFTER_RE.search(content)
+                    if not unavailable_match:
+                        continue
+                    category, issue, description, priority, issue_type = issue_spec
+                    description = description.format(date_str=unavailable_match.group(1))
+                    issue_spec = (category, issue, description, priority, issue_type)
+                elif directive not in directives:
+                    continue
+                
+                if affected_element is None:
+                    affected_element = self.truncate_element(meta)
+                add_issue_spec(issue_spec, affected_element=affected_element)
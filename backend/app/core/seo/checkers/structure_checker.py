@@ -1,29 +1,131 @@
 from .base_checker import BaseChecker
 from typing import Dict, Any, List, Set, Optional
+from bs4 import BeautifulSoup
 import json
-import re
+
+# 可选依赖：orjson 解析JSON比标准库快数倍
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# RDFa/Open Graph常用的property前缀
+RDFA_PROPERTY_PREFIXES = ('og:', 'article:', 'schema:')
+
+# 推荐的Open Graph属性
+OPEN_GRAPH_PROPERTIES = ('og:title', 'og:type', 'og:image', 'og:url')
+
+
+def _rich_result_rule(label: str, required_fields: List[str], recommended_fields: List[str],
+                      extra_check: str) -> tuple:
+    """
+    构造富结果规则，字段同时保存为有序元组（保持提示信息中的字段顺序）
+    和frozenset（字段齐全时用一次子集判断跳过逐个检查）
+    """
+    return (label,
+            tuple(required_fields), frozenset(required_fields),
+            tuple(recommended_fields), frozenset(recommended_fields),
+            extra_check)
+
+
+# 富结果类型规则：小写@type -> 规则
+_PRODUCT_RULE = _rich_result_rule('Product', ['name', 'offers'],
+                                  ['image', 'description', 'brand', 'review', 'aggregateRating'],
+                                  '_check_product_offers')
+_ARTICLE_RULE = _rich_result_rule('Article', ['headline', 'author', 'datePublished'],
+                                  ['image', 'publisher', 'dateModified', 'mainEntityOfPage'],
+                                  '_check_article_headline')
+_LOCAL_BUSINESS_RULE = _rich_result_rule('LocalBusiness', ['name', 'address'],
+                                         ['telephone', 'openingHours', 'priceRange', 'geo'],
+                                         '_check_local_business_address')
+
+RICH_RESULT_RULES = {
+    'product': _PRODUCT_RULE,
+    'article': _ARTICLE_RULE,
+    'newsarticle': _ARTICLE_RULE,
+    'blogposting': _ARTICLE_RULE,
+    'localbusiness': _LOCAL_BUSINESS_RULE,
+    'restaurant': _LOCAL_BUSINESS_RULE,
+    'store': _LOCAL_BUSINESS_RULE,
+}
+
+
+def parse_json(content: str) -> Any:
+    """
+    解析JSON文本，优先使用orjson；orjson拒绝的输入（NaN、无法编码的代理字符等）
+    交给标准库处理，保证可接受的输入和报错信息与json.loads一致
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content.encode('utf-8'))
+        except (orjson.JSONDecodeError, UnicodeEncodeError):
+            pass
+    return json.loads(content)
+
 
 class StructureChecker(BaseChecker):
     """检查页面结构化数据相关的SEO问题"""
     
+    def __init__(self, soup: BeautifulSoup, page_url: Optional[str] = None):
+        super().__init__(soup, page_url)
+        self._tag_index = None
+    
     def check(self) -> Dict[str, List[Dict[str, Any]]]:
         """执行所有结构化数据相关检查"""
+        self._get_tag_index()
         self.check_structured_data()
         self.check_javascript()
         
         return self.get_issues()
     
+    def _get_tag_index(self) -> Dict[str, List[Any]]:
+        """
+        遍历一次文档树，收集JSON-LD脚本、Microdata、RDFa元素和内联脚本，
+        避免各检查方法分别调用find_all重复遍历整棵树
+        """
+        if self._tag_index is not None:
+            return self._tag_index
+        
+        index = {
+            'json_ld_scripts': [],
+            'microdata': [],
+            'rdfa_property': [],
+            'rdfa_vocab': [],
+            'rdfa_typeof': [],
+            'inline_scripts': [],
+        }
+        
+        for el in self.get_all_tags():
+            attrs = el.attrs
+            
+            if el.name == 'script':
+                if attrs.get('type') == 'application/ld+json':
+                    index['json_ld_scripts'].append(el)
+                if attrs.get('src') is None:
+                    index['inline_scripts'].append(el)
+            
+            if attrs.get('itemtype') is not None:
+                index['microdata'].append(el)
+            
+            prop = attrs.get('property')
+            if prop is not None and prop.startswith(RDFA_PROPERTY_PREFIXES):
+                index['rdfa_property'].append(el)
+            if attrs.get('vocab') is not None:
+                index['rdfa_vocab'].append(el)
+            if attrs.get('typeof') is not None:
+                index['rdfa_typeof'].append(el)
+        
+        self._tag_index = index
+        return index
+    
     def check_structured_data(self):
         """检查结构化数据相关问题"""
-        import json
-        import re
+        tag_index = self._get_tag_index()
         
         # 检查不同类型的结构化数据
-        json_ld_scripts = self.soup.find_all('script', attrs={'type': 'application/ld+json'})
-        microdata_elements = self.soup.find_all(attrs={'itemtype': True})
-        rdfa_elements = self.soup.find_all(attrs={'property': re.compile('^og:|^article:|^schema:')}) or \
-                    self.soup.find_all(attrs={'vocab': True}) or \
-                    self.soup.find_all(attrs={'typeof': True})
+        json_ld_scripts = tag_index['json_ld_scripts']
+        microdata_elements = tag_index['microdata']
+        rdfa_elements = tag_index['rdfa_property'] or tag_index['rdfa_vocab'] or tag_index['rdfa_typeof']
         
         # 没有任何结构化数据
         if not (json_ld_scripts or microdata_elements or rdfa_elements):
@@ -50,35 +152,53 @@ class StructureChecker(BaseChecker):
 
     def _check_json_ld_data(self, json_ld_scripts):
         """检查JSON-LD结构化数据"""
-        import json
-        
         for script in json_ld_scripts:
+            # 每个脚本只序列化一次，供所有问题的affected_element复用
+            snippet = self.truncate_element(script)
             try:
                 # 尝试解析JSON
                 json_content = script.string
-                if not json_content or json_content.strip() == '':
+                stripped_content = json_content.strip() if json_content else ''
+                if not stripped_content:
                     self.add_issue(
                         category="Structured Data",
                         issue="Parse Errors",
                         description="JSON-LD脚本存在但内容为空",
                         priority="high",
-                        affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
+                        affected_element=snippet,
+                        issue_type="issues"
+                    )
+                    continue
+                
+                # 顶层必须为对象或对象数组；不以{或[开头的内容（标量、模板占位符、注释等）
+                # 不可能符合要求，无需调用JSON解析器
+                first_char = stripped_content[0]
+                if first_char != '{' and first_char != '[':
+                    self.add_issue(
+                        category="Structured Data",
+                        issue="Validation Errors",
+                        description="JSON-LD格式无效，应为对象或对象数组",
+                        priority="high",
+                        affected_element=snippet,
                         issue_type="issues"
                     )
                     continue
                     
-                json_data = json.loads(json_content)
+                json_data = parse_json(json_content)
                 
-                # 检查必要的字段
-                self._validate_json_ld_structure(json_data, script)
+                # 以{开头解析结果必为对象，以[开头必为数组（数组中的非对象项忽略）
+                if first_char == '{':
+                    items = [json_data]
+                else:
+                    items = [item for item in json_data if isinstance(item, dict)]
+                
+                # 检查必要的字段（先报告所有对象的结构问题，再报告富结果问题）
+                for item in items:
+                    self._validate_json_ld_structure(item, snippet)
                 
                 # 检查特定类型的富结果要求
-                if isinstance(json_data, dict):
-                    self._check_rich_results(json_data, script)
-                elif isinstance(json_data, list):
-                    for item in json_data:
-                        if isinstance(item, dict):
-                            self._check_rich_results(item, script)
+                for item in items:
+                    self._check_rich_results(item, snippet)
                     
             except json.JSONDecodeError as e:
                 self.add_issue(
@@ -86,7 +206,7 @@ class StructureChecker(BaseChecker):
                     issue="Parse Errors",
                     description=f"JSON-LD解析错误: {str(e)}",
                     priority="high",
-                    affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
+                    affected_element=snippet,
                     issue_type="issues"
                 )
             except Exception as e:
@@ -95,61 +215,45 @@ class StructureChecker(BaseChecker):
                     issue="Validation Errors",
                     description=f"结构化数据验证错误: {str(e)}",
                     priority="medium",
-                    affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
+                    affected_element=snippet,
                     issue_type="issues"
                 )
 
-    def _validate_json_ld_structure(self, json_data, script):
-        """验证JSON-LD结构"""
-        # 检查基本结构
-        if isinstance(json_data, dict):
-            # 检查@context字段
-            if '@context' not in json_data:
-                self.add_issue(
-                    category="Structured Data",
-                    issue="Validation Errors",
-                    description="JSON-LD缺少必要的@context字段，应为'https://schema.org'或相关值",
-                    priority="high",
-                    affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
-                    issue_type="issues"
-                )
-            elif not isinstance(json_data['@context'], (str, list, dict)) or \
-                (isinstance(json_data['@context'], str) and 'schema.org' not in json_data['@context']):
-                self.add_issue(
-                    category="Structured Data",
-                    issue="Validation Warnings",
-                    description="JSON-LD的@context字段可能不正确，推荐使用'https://schema.org'",
-                    priority="medium",
-                    affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
-                    issue_type="warnings"
-                )
-                
-            # 检查@type字段
-            if '@type' not in json_data:
-                self.add_issue(
-                    category="Structured Data",
-                    issue="Validation Errors",
-                    description="JSON-LD缺少必要的@type字段，用于定义数据类型",
-                    priority="high",
-                    affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
-                    issue_type="issues"
-                )
-        elif isinstance(json_data, list):
-            # 检查列表中的每个项目
-            for item in json_data:
-                if isinstance(item, dict):
-                    self._validate_json_ld_structure(item, script)
-        else:
+    def _validate_json_ld_structure(self, json_data, snippet):
+        """验证单个JSON-LD对象的结构"""
+        # 检查@context字段
+        if '@context' not in json_data:
             self.add_issue(
                 category="Structured Data",
                 issue="Validation Errors",
-                description="JSON-LD格式无效，应为对象或对象数组",
+                description="JSON-LD缺少必要的@context字段，应为'https://schema.org'或相关值",
                 priority="high",
-                affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
+                affected_element=snippet,
+                issue_type="issues"
+            )
+        elif not isinstance(json_data['@context'], (str, list, dict)) or \
+            (isinstance(json_data['@context'], str) and 'schema.org' not in json_data['@context']):
+            self.add_issue(
+                category="Structured Data",
+                issue="Validation Warnings",
+                description="JSON-LD的@context字段可能不正确，推荐使用'https://schema.org'",
+                priority="medium",
+                affected_element=snippet,
+                issue_type="warnings"
+            )
+            
+        # 检查@type字段
+        if '@type' not in json_data:
+            self.add_issue(
+                category="Structured Data",
+                issue="Validation Errors",
+                description="JSON-LD缺少必要的@type字段，用于定义数据类型",
+                priority="high",
+                affected_element=snippet,
                 issue_type="issues"
             )
 
-    def _check_rich_results(self, json_data, script):
+    def _check_rich_results(self, json_data, snippet):
         """检查富结果类型的特定要求"""
         # 获取类型
         data_type = json_data.get('@type', '')
@@ -163,202 +267,163 @@ class StructureChecker(BaseChecker):
         # 根据不同类型验证必要的属性
         data_type = data_type.lower()
         
-        # 1. 检查Product类型
-        if data_type == 'product':
-            required_fields = ['name', 'offers']
-            recommended_fields = ['image', 'description', 'brand', 'review', 'aggregateRating']
-            
-            missing_required = [field for field in required_fields if field not in json_data]
-            missing_recommended = [field for field in recommended_fields if field not in json_data]
-            
-            if missing_required:
-                self.add_issue(
-                    category="Structured Data",
-                    issue="Rich Result Validation Errors",
-                    description=f"Product类型缺少必要字段: {', '.join(missing_required)}",
-                    priority="high",
-                    affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
-                    issue_type="issues"
-                )
-                
-            if missing_recommended:
-                self.add_issue(
-                    category="Structured Data",
-                    issue="Rich Result Validation Warnings",
-                    description=f"Product类型缺少推荐字段: {', '.join(missing_recommended)}",
-                    priority="medium",
-                    affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
-                    issue_type="opportunities"
-                )
-                
-            # 检查offers结构
-            if 'offers' in json_data:
-                offers = json_data['offers']
-                if isinstance(offers, dict):
-                    if 'price' not in offers or 'priceCurrency' not in offers:
-                        self.add_issue(
-                            category="Structured Data",
-                            issue="Rich Result Validation Errors",
-                            description="Product类型的offers缺少price或priceCurrency字段",
-                            priority="high",
-                            affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
-                            issue_type="issues"
-                        )
+        # FAQPage的要求在mainEntity的各个问题上，单独检查
+        if data_type == 'faqpage':
+            self._check_faq_page(json_data, snippet)
+            return
         
-        # 2. 检查Article类型
-        elif data_type == 'article' or data_type == 'newsarticle' or data_type == 'blogposting':
-            required_fields = ['headline', 'author', 'datePublished']
-            recommended_fields = ['image', 'publisher', 'dateModified', 'mainEntityOfPage']
-            
-            missing_required = [field for field in required_fields if field not in json_data]
-            missing_recommended = [field for field in recommended_fields if field not in json_data]
-            
-            if missing_required:
-                self.add_issue(
-                    category="Structured Data",
-                    issue="Rich Result Validation Errors",
-                    description=f"Article类型缺少必要字段: {', '.join(missing_required)}",
-                    priority="high",
-                    affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
-                    issue_type="issues"
-                )
-                
-            if missing_recommended:
-                self.add_issue(
-                    category="Structured Data",
-                    issue="Rich Result Validation Warnings",
-                    description=f"Article类型缺少推荐字段: {', '.join(missing_recommended)}",
-                    priority="medium",
-                    affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
-                    issue_type="opportunities"
-                )
-                
-            # 检查标题长度
-            if 'headline' in json_data and len(json_data['headline']) > 110:
-                self.add_issue(
-                    category="Structured Data",
-                    issue="Rich Result Validation Warnings",
-                    description=f"Article类型的headline超过110个字符的Google推荐长度",
-                    priority="medium",
-                    affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
-                    issue_type="warnings"
-                )
+        rule = RICH_RESULT_RULES.get(data_type)
+        if rule is None:
+            return
         
-        # 3. 检查LocalBusiness类型
-        elif data_type == 'localbusiness' or data_type == 'restaurant' or data_type == 'store':
-            required_fields = ['name', 'address']
-            recommended_fields = ['telephone', 'openingHours', 'priceRange', 'geo']
-            
-            missing_required = [field for field in required_fields if field not in json_data]
-            missing_recommended = [field for field in recommended_fields if field not in json_data]
+        label, required_fields, required_set, recommended_fields, recommended_set, extra_check = rule
+        
+        # 字段齐全是常见情况，先用子集判断，缺字段时再按声明顺序列出
+        missing_required = [] if required_set.issubset(json_data) else \
+            [field for field in required_fields if field not in json_data]
+        missing_recommended = [] if recommended_set.issubset(json_data) else \
+            [field for field in recommended_fields if field not in json_data]
+        
+        if missing_required:
+            self.add_issue(
+                category="Structured Data",
+                issue="Rich Result Validation Errors",
+                description=f"{label}类型缺少必要字段: {', '.join(missing_required)}",
+                priority="high",
+                affected_element=snippet,
+                issue_type="issues"
+            )
             
-            if missing_required:
-                self.add_issue(
-                    category="Structured Data",
-                    issue="Rich Result Validation Errors",
-                    description=f"LocalBusiness类型缺少必要字段: {', '.join(missing_required)}",
-                    priority="high",
-                    affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
-                    issue_type="issues"
-                )
-                
-            if missing_recommended:
-                self.add_issue(
-                    category="Structured Data",
-                    issue="Rich Result Validation Warnings",
-                    description=f"LocalBusiness类型缺少推荐字段: {', '.join(missing_recommended)}",
-                    priority="medium",
-                    affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
-                    issue_type="opportunities"
-                )
-                
-            # 检查address结构
-            if 'address' in json_data:
-                address = json_data['address']
-                if isinstance(address, dict):
-                    if '@type' not in address or address.get('@type') != 'PostalAddress':
-                        self.add_issue(
-                            category="Structured Data",
-                            issue="Validation Warnings",
-                            description="LocalBusiness的address应使用PostalAddress类型",
-                            priority="medium",
-                            affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
-                            issue_type="warnings"
-                        )
-                        
-                    # 检查地址必要字段
-                    address_fields = ['streetAddress', 'addressLocality', 'postalCode']
-                    missing_address = [field for field in address_fields if field not in address]
-                    if missing_address:
-                        self.add_issue(
-                            category="Structured Data",
-                            issue="Rich Result Validation Warnings",
-                            description=f"LocalBusiness的address缺少推荐字段: {', '.join(missing_address)}",
-                            priority="medium",
-                            affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
-                            issue_type="warnings"
-                        )
+        if missing_recommended:
+            self.add_issue(
+                category="Structured Data",
+                issue="Rich Result Validation Warnings",
+                description=f"{label}类型缺少推荐字段: {', '.join(missing_recommended)}",
+                priority="medium",
+                affected_element=snippet,
+                issue_type="opportunities"
+            )
         
-        # 4. 检查FAQPage类型
-        elif data_type == 'faqpage':
-            if 'mainEntity' not in json_data:
-                self.add_issue(
-                    category="Structured Data",
-                    issue="Rich Result Validation Errors",
-                    description="FAQPage类型缺少必要的mainEntity字段",
-                    priority="high",
-                    affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
-                    issue_type="issues"
-                )
-            else:
-                entities = json_data['mainEntity']
-                if not isinstance(entities, list):
-                    entities = [entities]
+        # 类型特有的附加检查
+        getattr(self, extra_check)(json_data, snippet)
+    
+    def _check_product_offers(self, json_data, snippet):
+        """检查Product的offers结构"""
+        if 'offers' in json_data:
+            offers = json_data['offers']
+            if isinstance(offers, dict):
+                if 'price' not in offers or 'priceCurrency' not in offers:
+                    self.add_issue(
+                        category="Structured Data",
+                        issue="Rich Result Validation Errors",
+                        description="Product类型的offers缺少price或priceCurrency字段",
+                        priority="high",
+                        affected_element=snippet,
+                        issue_type="issues"
+                    )
+    
+    def _check_article_headline(self, json_data, snippet):
+        """检查Article的标题长度"""
+        if 'headline' in json_data and len(json_data['headline']) > 110:
+            self.add_issue(
+                category="Structured Data",
+                issue="Rich Result Validation Warnings",
+                description=f"Article类型的headline超过110个字符的Google推荐长度",
+                priority="medium",
+                affected_element=snippet,
+                issue_type="warnings"
+            )
+    
+    def _check_local_business_address(self, json_data, snippet):
+        """检查LocalBusiness的address结构"""
+        if 'address' in json_data:
+            address = json_data['address']
+            if isinstance(address, dict):
+                if '@type' not in address or address.get('@type') != 'PostalAddress':
+                    self.add_issue(
+                        category="Structured Data",
+                        issue="Validation Warnings",
+                        description="LocalBusiness的address应使用PostalAddress类型",
+                        priority="medium",
+                        affected_element=snippet,
+                        issue_type="warnings"
+                    )
                     
-                for entity in entities:
-                    if not isinstance(entity, dict) or '@type' not in entity or entity.get('@type') != 'Question':
-                        self.add_issue(
-                            category="Structured Data",
-                            issue="Rich Result Validation Errors",
-                            description="FAQPage的mainEntity应包含Question类型的项目",
-                            priority="high",
-                            affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
-                            issue_type="issues"
-                        )
-                    elif 'name' not in entity or 'acceptedAnswer' not in entity:
-                        self.add_issue(
-                            category="Structured Data",
-                            issue="Rich Result Validation Errors",
-                            description="Question类型缺少name(问题)或acceptedAnswer(答案)字段",
-                            priority="high",
-                            affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
-                            issue_type="issues"
-                        )
-                    elif isinstance(entity.get('acceptedAnswer'), dict) and \
-                        ('@type' not in entity['acceptedAnswer'] or entity['acceptedAnswer'].get('@type') != 'Answer'):
-                        self.add_issue(
-                            category="Structured Data",
-                            issue="Rich Result Validation Warnings",
-                            description="acceptedAnswer字段应使用Answer类型",
-                            priority="medium",
-                            affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
-                            issue_type="warnings"
-                        )
-                    elif isinstance(entity.get('acceptedAnswer'), dict) and 'text' not in entity['acceptedAnswer']:
-                        self.add_issue(
-                            category="Structured Data",
-                            issue="Rich Result Validation Errors",
-                            description="Answer类型缺少必要的text字段",
-                            priority="high",
-                            affected_element=str(script)[:100] + ('...' if len(str(script)) > 100 else ''),
-                            issue_type="issues"
-                        )
+                # 检查地址必要字段
+                address_fields = ['streetAddress', 'addressLocality', 'postalCode']
+                missing_address = [field for field in address_fields if field not in address]
+                if missing_address:
+                    self.add_issue(
+                        category="Structured Data",
+                        issue="Rich Result Validation Warnings",
+                        description=f"LocalBusiness的address缺少推荐字段: {', '.join(missing_address)}",
+                        priority="medium",
+                        affected_element=snippet,
+                        issue_type="warnings"
+                    )
+    
+    def _check_faq_page(self, json_data, snippet):
+        """检查FAQPage的mainEntity结构"""
+        if 'mainEntity' not in json_data:
+            self.add_issue(
+                category="Structured Data",
+                issue="Rich Result Validation Errors",
+                description="FAQPage类型缺少必要的mainEntity字段",
+                priority="high",
+                affected_element=snippet,
+                issue_type="issues"
+            )
+        else:
+            entities = json_data['mainEntity']
+            if not isinstance(entities, list):
+                entities = [entities]
+                
+            for entity in entities:
+                if not isinstance(entity, dict) or '@type' not in entity or entity.get('@type') != 'Question':
+                    self.add_issue(
+                        category="Structured Data",
+                        issue="Rich Result Validation Errors",
+                        description="FAQPage的mainEntity应包含Question类型的项目",
+                        priority="high",
+                        affected_element=snippet,
+                        issue_type="issues"
+                    )
+                elif 'name' not in entity or 'acceptedAnswer' not in entity:
+                    self.add_issue(
+                        category="Structured Data",
+                        issue="Rich Result Validation Errors",
+                        description="Question类型缺少name(问题)或acceptedAnswer(答案)字段",
+                        priority="high",
+                        affected_element=snippet,
+                        issue_type="issues"
+                    )
+                elif isinstance(entity.get('acceptedAnswer'), dict) and \
+                    ('@type' not in entity['acceptedAnswer'] or entity['acceptedAnswer'].get('@type') != 'Answer'):
+                    self.add_issue(
+                        category="Structured Data",
+                        issue="Rich Result Validation Warnings",
+                        description="acceptedAnswer字段应使用Answer类型",
+                        priority="medium",
+                        affected_element=snippet,
+                        issue_type="warnings"
+                    )
+                elif isinstance(entity.get('acceptedAnswer'), dict) and 'text' not in entity['acceptedAnswer']:
+                    self.add_issue(
+                        category="Structured Data",
+                        issue="Rich Result Validation Errors",
+                        description="Answer类型缺少必要的text字段",
+                        priority="high",
+                        affected_element=snippet,
+                        issue_type="issues"
+                    )
 
     def _check_microdata(self, microdata_elements):
         """检查Microdata结构化数据"""
-        # 检查itemtype是否有效
+        # 一次遍历收集itemtype、缺少itemscope的元素，以及有itemscope但没有itemprop的元素
         valid_itemtypes = False
         itemtype_urls = set()
+        elements_without_scope = []
+        scoped_without_itemprop = []
         
         for element in microdata_elements:
             itemtype = element.get('itemtype', '')
@@ -366,7 +431,14 @@ class StructureChecker(BaseChecker):
                 itemtype_urls.add(itemtype)
                 if 'schema.org' in itemtype:
                     valid_itemtypes = True
+            
+            if not element.has_attr('itemscope'):
+                elements_without_scope.append(element)
+            # 检查此元素或其子元素是否有itemprop（只需判断存在，find命中即停止）
+            elif not (element.has_attr('itemprop') or element.find(attrs={'itemprop': True})):
+                scoped_without_itemprop.append(element)
         
+        # 检查itemtype是否有效
         if not valid_itemtypes:
             self.add_issue(
                 category="Structured Data",
@@ -377,52 +449,43 @@ class StructureChecker(BaseChecker):
             )
         
         # 检查itemscope
-        elements_without_scope = []
-        for element in microdata_elements:
-            if not element.has_attr('itemscope'):
-                elements_without_scope.append(element)
-        
         if elements_without_scope:
             self.add_issue(
                 category="Structured Data",
                 issue="Validation Errors",
                 description=f"有{len(elements_without_scope)}个使用itemtype的元素没有设置itemscope属性",
                 priority="high",
-                affected_element=str(elements_without_scope[0])[:100] + ('...' if len(str(elements_without_scope[0])) > 100 else ''),
+                affected_element=self.truncate_element(elements_without_scope[0]),
                 issue_type="issues"
             )
         
         # 检查itemprop
-        for element in microdata_elements:
-            if element.has_attr('itemscope'):
-                # 检查此元素或其子元素是否有itemprop
-                if not (element.has_attr('itemprop') or element.find_all(attrs={'itemprop': True})):
-                    self.add_issue(
-                        category="Structured Data",
-                        issue="Validation Warnings",
-                        description="找到具有itemscope的元素，但没有相关的itemprop属性",
-                        priority="medium",
-                        affected_element=str(element)[:100] + ('...' if len(str(element)) > 100 else ''),
-                        issue_type="warnings"
-                    )
+        for element in scoped_without_itemprop:
+            self.add_issue(
+                category="Structured Data",
+                issue="Validation Warnings",
+                description="找到具有itemscope的元素，但没有相关的itemprop属性",
+                priority="medium",
+                affected_element=self.truncate_element(element),
+                issue_type="warnings"
+            )
 
     def _check_rdfa(self, rdfa_elements):
         """检查RDFa结构化数据"""
-        # 检查常见的Open Graph属性
-        og_properties = {
-            'og:title': False,
-            'og:type': False, 
-            'og:image': False,
-            'og:url': False
-        }
-        
+        # 一次遍历收集出现的property以及vocab/typeof的使用情况
+        found_properties = set()
+        has_vocab = False
+        has_typeof = False
         for element in rdfa_elements:
-            prop = element.get('property', '')
-            if prop in og_properties:
-                og_properties[prop] = True
+            attrs = element.attrs
+            found_properties.add(attrs.get('property', ''))
+            if 'vocab' in attrs:
+                has_vocab = True
+            if 'typeof' in attrs:
+                has_typeof = True
         
-        # 检查是否缺少必要的OG属性
-        missing_og = [prop for prop, found in og_properties.items() if not found]
+        # 检查是否缺少必要的OG属性（按推荐顺序列出）
+        missing_og = [prop for prop in OPEN_GRAPH_PROPERTIES if prop not in found_properties]
         if missing_og:
             self.add_issue(
                 category="Structured Data",
@@ -433,9 +496,6 @@ class StructureChecker(BaseChecker):
             )
         
         # 检查其他RDFa属性
-        has_vocab = any(element.has_attr('vocab') for element in rdfa_elements)
-        has_typeof = any(element.has_attr('typeof') for element in rdfa_elements)
-        
         if has_typeof and not has_vocab:
             self.add_issue(
                 category="Structured Data",
@@ -450,7 +510,7 @@ class StructureChecker(BaseChecker):
         # 由于静态分析限制，只能做基本检查
         
         # 检查是否有内联JavaScript
-        inline_scripts = self.soup.find_all('script', src=None)
+        inline_scripts = self._get_tag_index()['inline_scripts']
         if inline_scripts and any(len(script.string or '') > 500 for script in inline_scripts):
             self.add_issue(
                 category="JavaScript",
@@ -1,5 +1,7 @@
-import os
-import tempfile
+import codecs
+import copy
+import hashlib
+from collections import Counter, OrderedDict
 from typing import Dict, Any, List, Optional, Set, Tuple
 from fastapi import UploadFile
 from bs4 import BeautifulSoup
@@ -17,6 +19,66 @@ from app.core.seo.checkers.accessibility_checker import AccessibilityChecker
 
 logger = logging.getLogger(__name__)
 
+# lxml is a C parser and several times faster than html.parser; fall back if it is missing
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# 上传文件分块读取的大小（1 MiB）
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# SEO评分中各(问题类型, 优先级)的扣分权重，其他优先级不扣分
+SEO_SCORE_WEIGHTS = {
+    ("issues", "high"): 15, ("issues", "medium"): 8, ("issues", "low"): 3,
+    ("warnings", "high"): 8, ("warnings", "medium"): 4, ("warnings", "low"): 2,
+    ("opportunities", "high"): 3, ("opportunities", "medium"): 2, ("opportunities", "low"): 1,
+}
+
+# 分析结果缓存：相同内容和相同选项的文件重复上传时直接复用结果（LRU淘汰）
+RESULT_CACHE_MAX_SIZE = 256
+# 所有缓存条目中提取正文的总字符数上限，避免大页面占满内存
+RESULT_CACHE_MAX_TEXT_CHARS = 16 * 1024 * 1024
+# (内容sha256, content_extractor, enable_advanced_analysis) -> (page_url, issues, extracted_content)
+_result_cache = OrderedDict()
+# 当前缓存条目的提取正文总字符数
+_result_cache_text_chars = 0
+
+
+def _get_cached_result(key: Tuple[str, str, bool]):
+    """读取缓存的(page_url, issues, extracted_content)，返回副本，未命中返回None"""
+    cached = _result_cache.get(key)
+    if cached is None:
+        return None
+    _result_cache.move_to_end(key)
+    return copy.deepcopy(cached)
+
+
+def _cached_text_chars(result: Tuple[Optional[str], Dict[str, Any], Dict[str, Any]]) -> int:
+    """缓存条目中提取正文的字符数"""
+    return len(result[2].get("text") or "")
+
+
+def _store_cached_result(key: Tuple[str, str, bool], result: Tuple[Optional[str], Dict[str, Any], Dict[str, Any]]) -> None:
+    """保存分析结果的副本，超出条目数或正文总字符数上限时淘汰最久未使用的条目"""
+    global _result_cache_text_chars
+    
+    text_chars = _cached_text_chars(result)
+    if text_chars > RESULT_CACHE_MAX_TEXT_CHARS:
+        # 单个结果就超出上限，不缓存
+        return
+    
+    old = _result_cache.pop(key, None)
+    if old is not None:
+        _result_cache_text_chars -= _cached_text_chars(old)
+    _result_cache[key] = copy.deepcopy(result)
+    _result_cache_text_chars += text_chars
+    
+    while len(_result_cache) > RESULT_CACHE_MAX_SIZE or _result_cache_text_chars > RESULT_CACHE_MAX_TEXT_CHARS:
+        _, evicted = _result_cache.popitem(last=False)
+        _result_cache_text_chars -= _cached_text_chars(evicted)
+
 
 class SEOProcessor:
     def __init__(self):
@@ -57,26 +119,48 @@ class SEOProcessor:
         enable_advanced_analysis: bool = True
     ) -> Dict[str, Any]:
         """处理单个文件（保持原有接口不变）"""
-        # 创建临时文件存储上传内容
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as temp_file:
-            # 写入上传文件内容到临时文件
-            content = await file.read()
-            temp_file.write(content)
-            temp_file.flush()
-            
-            # 解析HTML内容
-            self.html_content = content.decode('utf-8', errors='replace')
-            self.soup = BeautifulSoup(self.html_content, 'html.parser')
+        # 分块读取上传内容并增量解码，不经过临时文件，也不在内存中保留完整的bytes副本
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        content_hash = hashlib.sha256()
+        parts = []
+        while True:
+            chunk = await file.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            content_hash.update(chunk)
+            parts.append(decoder.decode(chunk))
+        parts.append(decoder.decode(b'', final=True))
+        html_content = ''.join(parts)
+        
+        # 分析结果只取决于文件内容和分析选项，重复上传时直接复用缓存结果
+        cache_key = (content_hash.hexdigest(), content_extractor, enable_advanced_analysis)
+        cached = _get_cached_result(cache_key)
+        if cached is not None:
+            # 命中缓存时不解析HTML，需要时由_ensure_soup按html_content延迟解析
+            soup = None
+            page_url, issues, extracted_content = cached
+        else:
+            # 解析HTML内容，并尝试从HTML中提取页面URL
+            soup = BeautifulSoup(html_content, HTML_PARSER)
+            page_url = self.find_page_url(soup)
             
-            # 尝试从HTML中提取页面URL
-            self.extract_page_url()
+            # 执行所有检查，传入提取引擎和高级分析选项。
+            # 等待期间其他请求可能使用同一个处理器实例，因此结果先保存在局部变量中
+            issues, extracted_content, failed = await self._run_all_checkers_in_executor(
+                soup, page_url, content_extractor, enable_advanced_analysis
+            )
             
-            # 执行所有检查，传入提取引擎和高级分析选项
-            await self.check_all_seo_issues(content_extractor, enable_advanced_analysis)
-            
-            # 清理临时文件
-            temp_file.close()
-            os.unlink(temp_file.name)
+            # 缓存本次分析在局部变量中得到的结果，而不是可能被其他请求改写的实例属性。
+            # 有检查器出错或高级分析失败时不缓存，重新上传同一文件时会重新分析
+            if not failed:
+                _store_cached_result(cache_key, (page_url, issues, extracted_content))
+        
+        # 此后不再有await，写入实例状态并生成返回结果的过程不会与其他请求交错
+        self.html_content = html_content
+        self.soup = soup
+        self.page_url = page_url
+        self.issues = issues
+        self.extracted_content = extracted_content
             
         # 返回分析结果，包括提取的页面内容
         return {
@@ -387,64 +471,135 @@ class SEOProcessor:
             "total_opportunities": 0
         }
     
+    def _ensure_soup(self) -> BeautifulSoup:
+        """返回当前文件的soup；命中结果缓存时尚未解析，此时按html_content解析"""
+        if self.soup is None and self.html_content is not None:
+            self.soup = BeautifulSoup(self.html_content, HTML_PARSER)
+        return self.soup
+    
     # 以下保持原有方法不变...
     def extract_page_url(self) -> None:
         """从HTML中提取页面URL"""
+        page_url = self.find_page_url(self._ensure_soup())
+        if page_url:
+            self.page_url = page_url
+    
+    @staticmethod
+    def find_page_url(soup: BeautifulSoup) -> Optional[str]:
+        """依次从canonical、og:url和base标签中查找页面URL，找不到时返回None"""
         # 尝试从<link rel="canonical"> 标签获取
-        canonical = self.soup.find('link', rel='canonical')
+        canonical = soup.find('link', rel='canonical')
         if canonical and canonical.get('href'):
-            self.page_url = canonical.get('href')
-            return
+            return canonical.get('href')
         
         # 尝试从<meta property="og:url"> 标签获取
-        og_url = self.soup.find('meta', property='og:url')
+        og_url = soup.find('meta', property='og:url')
         if og_url and og_url.get('content'):
-            self.page_url = og_url.get('content')
-            return
+            return og_url.get('content')
         
         # 尝试从base标签获取
-        base = self.soup.find('base')
+        base = soup.find('base')
         if base and base.get('href'):
-            self.page_url = base.get('href')
+            return base.get('href')
+        
+        return None
     
     async def check_all_seo_issues(self, content_extractor: str = "auto", enable_advanced_analysis: bool = True) -> None:
-        # 清空之前的检查结果
-        self.issues = {
+        issues, extracted_content, _ = await self._run_all_checkers_in_executor(
+            self._ensure_soup(), self.page_url, content_extractor, enable_advanced_analysis
+        )
+        self.issues = issues
+        self.extracted_content = extracted_content
+    
+    async def _run_all_checkers_in_executor(
+        self,
+        soup: BeautifulSoup,
+        page_url: Optional[str],
+        content_extractor: str,
+        enable_advanced_analysis: bool
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Any], bool]:
+        # 检查器都是同步的CPU密集操作，放到线程池中执行，避免阻塞事件循环，
+        # 使process_files中的多个文件可以真正并发处理
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            self._run_all_checkers,
+            soup,
+            page_url,
+            content_extractor,
+            enable_advanced_analysis
+        )
+    
+    @staticmethod
+    def _run_all_checkers(
+        soup: BeautifulSoup,
+        page_url: Optional[str],
+        content_extractor: str,
+        enable_advanced_analysis: bool
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Any], bool]:
+        """
+        按固定顺序依次运行所有检查器，返回(issues, extracted_content, failed)，
+        failed表示有检查器出错或高级内容分析失败，这样的结果不应被缓存。
+        只使用局部状态，不读写处理器实例，可以安全地在线程池中运行。
+        ContentChecker会修改共享的soup，后面的检查器依赖修改后的文档树，
+        因此同一页面内的检查器不能并行执行。
+        """
+        issues = {
             "issues": [],
             "warnings": [],
             "opportunities": []
         }
+        extracted_content = {
+            "text": "",
+            "spelling_errors": [],
+            "grammar_errors": [],
+            "title": "",
+            "description": "",
+            "structure": []
+        }
         
         # 初始化并运行各个检查器，为ContentChecker传入特定参数
         checkers = [
-            TechnicalChecker(self.soup, self.page_url),       # 技术检查（响应码、安全性、URL）
-            MetaChecker(self.soup, self.page_url),            # 元数据检查（标题、描述等）
-            ContentChecker(self.soup, self.page_url, content_extractor, enable_advanced_analysis),  # 内容检查，传入新参数
-            LinkChecker(self.soup, self.page_url),            # 链接检查
-            StructureChecker(self.soup, self.page_url),       # 结构化数据检查
-            AccessibilityChecker(self.soup, self.page_url)    # 无障碍检查
+            TechnicalChecker(soup, page_url),       # 技术检查（响应码、安全性、URL）
+            MetaChecker(soup, page_url),            # 元数据检查（标题、描述等）
+            ContentChecker(soup, page_url, content_extractor, enable_advanced_analysis),  # 内容检查，传入新参数
+            LinkChecker(soup, page_url),            # 链接检查
+            StructureChecker(soup, page_url),       # 结构化数据检查
+            AccessibilityChecker(soup, page_url)    # 无障碍检查
         ]
         
+        # 文档标签列表在检查器之间共享，避免每个检查器各自遍历整棵树；
+        # ContentChecker会删除soup中的标签，之后的检查器需要重新收集
+        all_tags = None
+        failed = False
+        
         # 收集所有检查结果
         for checker in checkers:
+            if all_tags is not None:
+                checker.all_tags = all_tags
             try:
                 checker_issues = checker.check()
-                self.issues["issues"].extend(checker_issues.get("issues", []))
-                self.issues["warnings"].extend(checker_issues.get("warnings", []))
-                self.issues["opportunities"].extend(checker_issues.get("opportunities", []))
+                issues["issues"].extend(checker_issues.get("issues", []))
+                issues["warnings"].extend(checker_issues.get("warnings", []))
+                issues["opportunities"].extend(checker_issues.get("opportunities", []))
                 
                 # 获取内容检查器提取的内容
                 if isinstance(checker, ContentChecker):
-                    self.extracted_content = checker.get_extracted_content()
+                    extracted_content = checker.get_extracted_content()
+                    failed = failed or checker.analysis_failed
             except Exception as e:
+                failed = True
                 # 如果某个检查器出错，记录错误但不影响其他检查器
-                self.add_issue(
-                    category="System",
-                    issue="Checker Error",
-                    description=f"检查器 {checker.__class__.__name__} 执行时出错: {str(e)}",
-                    priority="low",
-                    issue_type="warnings"
-                )
+                issues["warnings"].append({
+                    "category": "System",
+                    "issue": "Checker Error",
+                    "description": f"检查器 {checker.__class__.__name__} 执行时出错: {str(e)}",
+                    "priority": "low"
+                })
+            
+            all_tags = None if isinstance(checker, ContentChecker) else checker.all_tags
+        
+        return issues, extracted_content, failed
     
     def add_issue(self, category: str, issue: str, description: str, priority: str, 
                   affected_element: Optional[str] = None, affected_resources: Optional[List[str]] = None,
@@ -474,12 +629,12 @@ class SEOProcessor:
         return self.extracted_content
             
     def get_issue_categories(self) -> Set[str]:
-        categories = set()
-        for issue_type in ["issues", "warnings", "opportunities"]:
-            for issue in self.issues[issue_type]:
-                if "category" in issue:
-                    categories.add(issue["category"])
-        return categories
+        return {
+            issue["category"]
+            for issue_type in ["issues", "warnings", "opportunities"]
+            for issue in self.issues[issue_type]
+            if "category" in issue
+        }
     
     def filter_issues_by_category(self, category: str) -> Dict[str, List[Dict[str, Any]]]:
         filtered_issues = {
@@ -544,14 +699,7 @@ class SEOProcessor:
     
     def get_categories(self) -> List[str]:
         """获取所有问题类别"""
-        categories = set()
-        
-        for issue_type in ["issues", "warnings", "opportunities"]:
-            for issue in self.issues[issue_type]:
-                if "category" in issue:
-                    categories.add(issue["category"])
-                    
-        return sorted(list(categories))
+        return sorted(self.get_issue_categories())
     
     def get_high_priority_issues(self) -> List[Dict[str, Any]]:
         """获取所有高优先级问题"""
@@ -567,28 +715,16 @@ class SEOProcessor:
     
     def has_critical_issues(self) -> bool:
         """检查是否存在关键问题"""
-        # 检查是否有高优先级的issues
-        for issue in self.issues["issues"]:
-            if issue.get("priority") == "high":
-                return True
-                
-        return False
+        # 检查是否有高优先级的issues，遇到第一个即返回
+        return any(issue.get("priority") == "high" for issue in self.issues["issues"])
     
     def calculate_seo_score(self) -> int:
-        # 问题权重
-        weights = {
-            "issues": {"high": 15, "medium": 8, "low": 3},
-            "warnings": {"high": 8, "medium": 4, "low": 2},
-            "opportunities": {"high": 3, "medium": 2, "low": 1}
-        }
-        
-        # 计算加权问题数
+        # 按(问题类型, 优先级)统计数量，再与权重相乘求和
         total_weighted_issues = 0
         for issue_type in ["issues", "warnings", "opportunities"]:
-            for issue in self.issues[issue_type]:
-                priority = issue.get("priority", "medium")
-                if priority in weights[issue_type]:
-                    total_weighted_issues += weights[issue_type][priority]
+            priority_counts = Counter(issue.get("priority", "medium") for issue in self.issues[issue_type])
+            for priority, count in priority_counts.items():
+                total_weighted_issues += SEO_SCORE_WEIGHTS.get((issue_type, priority), 0) * count
         
         # 基础分数100，每个加权问题减少相应分数
         score = max(0, 100 - total_weighted_issues)
@@ -3,9 +3,75 @@ SEO工具函数模块
 """
 
 import re
+import threading
 from typing import Dict, Any, List, Optional, Set, Tuple, Union
 from urllib.parse import urlparse, parse_qs
 
+# 可选依赖：Hyperscan 把多个文案编译成一个 DFA，批量扫描时比回溯正则更快
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+
+# 软404页面常见文案，一次不区分大小写的扫描即可完成匹配
+SOFT_404_PATTERNS = (
+    "找不到页面", "不存在", "已删除", "page not found", "404",
+    "does not exist", "no longer available", "been removed",
+    "无法找到", "抱歉，您访问的页面不存在", "sorry, the page you requested was not found"
+)
+SOFT_404_RE = re.compile('|'.join(re.escape(p) for p in SOFT_404_PATTERNS), re.IGNORECASE)
+
+# 文本处理中反复使用的正则，模块加载时编译一次
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+WHITESPACE_RE = re.compile(r'\s+')
+WORD_RE = re.compile(r'\b\w+\b')
+SENTENCE_SPLIT_RE = re.compile(r'[。！？.!?]')
+# Lorem Ipsum占位文本的三个常见片段合并为一个忽略大小写的交替模式，一次扫描即可
+LOREM_IPSUM_RE = re.compile(
+    r'lorem\s+ipsum|dolor\s+sit\s+amet|consectetur\s+adipiscing\s+elit',
+    re.IGNORECASE
+)
+NUMBER_RE = re.compile(r'-?\d+\.?\d*')
+EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+HEX_COLOR_RE = re.compile(r'^#[0-9a-fA-F]{3}$|^#[0-9a-fA-F]{6}$')
+
+# 无描述性的锚文本关键词，合并为一个忽略大小写的正则
+NON_DESCRIPTIVE_ANCHOR_TERMS = (
+    '点击这里', '查看更多', '了解详情', '详情', '点击', '这里', '更多',
+    'click here', 'read more', 'learn more', 'more', 'click', 'here',
+    'details', 'view more', 'see more'
+)
+NON_DESCRIPTIVE_ANCHOR_RE = re.compile('|'.join(map(re.escape, NON_DESCRIPTIVE_ANCHOR_TERMS)), re.IGNORECASE)
+
+# 连续的中文字符（CJK统一表意文字基本区），按段匹配比逐字符匹配产生的对象更少
+CHINESE_CHARS_RE = re.compile('[\u4e00-\u9fff]+')
+
+
+def _compile_soft_404_database():
+    if hyperscan is None:
+        return None
+
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP | hyperscan.HS_FLAG_SINGLEMATCH
+    try:
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[re.escape(p).encode('utf-8') for p in SOFT_404_PATTERNS],
+            ids=list(range(len(SOFT_404_PATTERNS))),
+            elements=len(SOFT_404_PATTERNS),
+            flags=[flags] * len(SOFT_404_PATTERNS)
+        )
+        return database
+    except Exception:
+        # 编译失败时退回到 re
+        return None
+
+
+SOFT_404_HS_DATABASE = _compile_soft_404_database()
+
+# Hyperscan 的 scratch 空间不能在线程间共享，每个线程各自分配一份
+_hyperscan_local = threading.local()
+
 
 def estimate_pixel_width(text: str) -> int:
     if not text:
@@ -78,11 +144,16 @@ def is_nofollow_link(rel_attr) -> bool:
     return False
 
 
+def count_chinese_chars(text: str) -> int:
+    """统计文本中的中文字符数，由正则在C层扫描，避免逐字符的Python循环"""
+    return sum(map(len, CHINESE_CHARS_RE.findall(text)))
+
+
 def get_language_from_html(text: str) -> str:
     if not text:
         return 'en-US'
         
-    chinese_chars = sum(1 for c in text if '\u4e00' <= c <= '\u9fff')
+    chinese_chars = count_chinese_chars(text)
     is_chinese = chinese_chars / len(text) > 0.5
     return 'zh-CN' if is_chinese else 'en-US'
 
@@ -111,21 +182,21 @@ def parse_url_parts(url: str) -> Dict[str, Any]:
 
 def extract_text_from_html(html_content: str) -> str:
     # 移除HTML标签
-    text = re.sub(r'<[^>]+>', ' ', html_content)
+    text = HTML_TAG_RE.sub(' ', html_content)
     # 移除多余空白
-    text = re.sub(r'\s+', ' ', text)
+    text = WHITESPACE_RE.sub(' ', text)
     return text.strip()
 
 
 def count_words(text: str) -> int:
     # 分割文本为单词
-    words = re.findall(r'\b\w+\b', text)
+    words = WORD_RE.findall(text)
     return len(words)
 
 
 def split_sentences(text: str) -> List[str]:
     # 使用常见的句子终止符
-    sentences = re.split(r'[。！？.!?]', text)
+    sentences = SENTENCE_SPLIT_RE.split(text)
     # 过滤空句子
     return [s.strip() for s in sentences if s.strip()]
 
@@ -138,44 +209,43 @@ def has_mixed_content(page_url: str, resource_url: str) -> bool:
 
 
 def contains_lorem_ipsum(text: str) -> bool:
-    lorem_patterns = [
-        r'lorem\s+ipsum',
-        r'dolor\s+sit\s+amet',
-        r'consectetur\s+adipiscing\s+elit',
-    ]
-    
-    text_lower = text.lower()
-    for pattern in lorem_patterns:
-        if re.search(pattern, text_lower):
-            return True
-            
-    return False
+    # 预编译的模式已忽略大小写，无需先复制一份小写文本
+    return LOREM_IPSUM_RE.search(text) is not None
+
+
+def find_soft_404_phrase(text: str) -> Optional[str]:
+    """返回文本中命中的第一个软404文案，未命中返回None"""
+    if not text:
+        return None
+
+    if SOFT_404_HS_DATABASE is not None:
+        scratch = getattr(_hyperscan_local, 'scratch', None)
+        if scratch is None:
+            scratch = _hyperscan_local.scratch = hyperscan.Scratch(SOFT_404_HS_DATABASE)
+
+        matches = []
+
+        def on_match(pattern_id, start, end, flags, context):
+            matches.append(pattern_id)
+            return True  # 命中一个即可停止扫描
+
+        try:
+            SOFT_404_HS_DATABASE.scan(text.encode('utf-8', 'replace'), match_event_handler=on_match, scratch=scratch)
+        except hyperscan.ScanTerminated:
+            pass
+        return SOFT_404_PATTERNS[matches[0]] if matches else None
+
+    match = SOFT_404_RE.search(text)
+    return match.group(0) if match else None
 
 
 def is_soft_404_content(text: str) -> bool:
-    soft_404_patterns = [
-        "找不到页面", "不存在", "已删除", "page not found", "404", 
-        "does not exist", "no longer available", "been removed",
-        "无法找到", "抱歉，您访问的页面不存在", "sorry, the page you requested was not found"
-    ]
-    
-    text_lower = text.lower()
-    for pattern in soft_404_patterns:
-        if pattern.lower() in text_lower:
-            return True
-            
-    return False
+    return find_soft_404_phrase(text) is not None
 
 
 def is_non_descriptive_anchor(text: str) -> bool:
-    non_descriptive_terms = [
-        '点击这里', '查看更多', '了解详情', '详情', '点击', '这里', '更多', 
-        'click here', 'read more', 'learn more', 'more', 'click', 'here', 
-        'details', 'view more', 'see more'
-    ]
-    
-    text_lower = text.lower().strip()
-    return any(term == text_lower or term in text_lower for term in non_descriptive_terms)
+    # 任一关键词作为子串出现即视为无描述性（相等的情况也包含在内）
+    return NON_DESCRIPTIVE_ANCHOR_RE.search(text) is not None
 
 
 def is_empty_or_whitespace(text: str) -> bool:
@@ -204,7 +274,7 @@ def normalize_whitespace(text: str) -> str:
         return ""
     
     # 将多个空白字符替换为单个空格
-    text = re.sub(r'\s+', ' ', text)
+    text = WHITESPACE_RE.sub(' ', text)
     return text.strip()
 
 
@@ -265,8 +335,7 @@ def extract_numbers_from_text(text: str) -> List[float]:
         return []
     
     # 匹配整数和小数
-    number_pattern = r'-?\d+\.?\d*'
-    matches = re.findall(number_pattern, text)
+    matches = NUMBER_RE.findall(text)
     
     numbers = []
     for match in matches:
@@ -304,13 +373,11 @@ def validate_html_attribute(attribute_value: str, attribute_type: str = "generic
     if attribute_type == "url":
         return is_valid_url(attribute_value)
     elif attribute_type == "email":
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(email_pattern, attribute_value))
+        return bool(EMAIL_RE.match(attribute_value))
     elif attribute_type == "color":
         # 支持hex颜色码和常见颜色名
-        color_pattern = r'^#[0-9a-fA-F]{3}$|^#[0-9a-fA-F]{6}$'
         common_colors = ['red', 'blue', 'green', 'yellow', 'black', 'white', 'gray']
-        return bool(re.match(color_pattern, attribute_value)) or attribute_value.lower() in common_colors
+        return bool(HEX_COLOR_RE.match(attribute_value)) or attribute_value.lower() in common_colors
     else:
         # 通用验证：不包含危险字符
         dangerous_chars = ['<', '>', '"', "'", '&']